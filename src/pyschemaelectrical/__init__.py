@@ -65,6 +65,7 @@ from .plc_resolver import (
     PlcRack,
     extract_plc_connections_from_registry,
     generate_plc_report_rows,
+    iter_plc_report_rows,
     resolve_plc_references,
 )
 from .project import Project
@@ -9,7 +9,9 @@ electrical symbols automatically. Key features include:
 - Vertical chain layout with automatic connections
 """
 
-from collections.abc import Callable
+import math
+from collections.abc import Callable, Sequence
+from functools import lru_cache, singledispatch
 from typing import Any
 
 from pyschemaelectrical.model.constants import DEFAULT_WIRE_ALIGNMENT_TOLERANCE
@@ -30,22 +32,7 @@ def get_connection_ports(symbol: Symbol, direction: Vector) -> list[Port]:
     Returns:
         list[Port]: A list of matching ports.
     """
-    matches = []
-    seen_positions = set()
-
-    for p in symbol.ports.values():
-        dx = abs(p.direction.dx - direction.dx)
-        dy = abs(p.direction.dy - direction.dy)
-        if dx < 1e-6 and dy < 1e-6:
-            # Check for spatial duplicates
-            # (e.g. aliased ports pointing to same location)
-            pos_key = (round(p.position.x, 4), round(p.position.y, 4))
-
-            if pos_key not in seen_positions:
-                matches.append(p)
-                seen_positions.add(pos_key)
-
-    return matches
+    return symbol.ports_facing(direction)
 
 
 def auto_connect(sym1: Symbol, sym2: Symbol) -> list[Line]:
@@ -62,35 +49,167 @@ def auto_connect(sym1: Symbol, sym2: Symbol) -> list[Line]:
     Returns:
         list[Line]: A list of connection lines.
     """
-    lines = []
+    down_ports = sym1.down_ports
+    if not down_ports:
+        return []
+    up_ports = sym2.up_ports
+    if not up_ports:
+        return []
+
+    # Reject pairs whose port X spans are more than a tolerance apart before
+    # building buckets; the nearest pair decides, so this drops no match.
+    tol = DEFAULT_WIRE_ALIGNMENT_TOLERANCE
+    down_xs = sym1.down_xs
+    up_xs = sym2.up_xs
+    if min(up_xs) - max(down_xs) >= tol or min(down_xs) - max(up_xs) >= tol:
+        return []
+
+    segments = []
+    buckets = _bucket_xs(up_xs)
+
+    for dp, x in zip(down_ports, down_xs, strict=True):
+        key = _x_bucket_key(x)
+        # Neighbouring buckets cover every port within tolerance; sort the
+        # indices so matches are emitted in up_ports order.
+        candidates = sorted(
+            i for k in (key - 1, key, key + 1) for i in buckets.get(k, ())
+        )
+        for i in candidates:
+            # Check vertical alignment (same X)
+            if abs(x - up_xs[i]) < tol:
+                segments.append((dp.position, up_ports[i].position))
 
-    down_ports = get_connection_ports(sym1, Vector(0, 1))
-    up_ports = get_connection_ports(sym2, Vector(0, -1))
+    style = standard_style()
+    return [Line(start, end, style=style) for start, end in segments]
 
-    for dp in down_ports:
-        for up in up_ports:
-            # Check vertical alignment (same X)
-            if abs(dp.position.x - up.position.x) < DEFAULT_WIRE_ALIGNMENT_TOLERANCE:
-                lines.append(Line(dp.position, up.position, style=standard_style()))
 
-    return lines
+def _x_bucket_key(x: float) -> int:
+    """Quantize an X coordinate into a bucket twice the alignment tolerance wide.
+
+    Two ports within tolerance of each other are always in the same or
+    adjacent buckets.
+    """
+    return math.floor(x / (2 * DEFAULT_WIRE_ALIGNMENT_TOLERANCE))
+
+
+def _bucket_xs(xs: Sequence[float]) -> dict[int, list[int]]:
+    """Index X coordinates by quantized X, mapping each bucket to indices."""
+    buckets: dict[int, list[int]] = {}
+    for i, x in enumerate(xs):
+        buckets.setdefault(_x_bucket_key(x), []).append(i)
+    return buckets
+
+
+def _match_xs(
+    down_xs: Sequence[float], up_xs: Sequence[float], tol: float
+) -> list[tuple[int, int]]:
+    """Pair X coordinates that lie within *tol* of each other.
+
+    Works on plain floats so the matching core is independent of ``Port``
+    objects.  Down indices are visited in ascending X order; each is paired
+    with the lowest up index whose X is within tolerance, if any.  An up
+    index may be paired with several down indices.
+
+    Both sides are sorted by X once and walked with a two-pointer sweep: the
+    start of the up window only ever moves forward, so the whole pass is
+    linear after sorting.
+
+    Returns:
+        ``(down_index, up_index)`` pairs.
+    """
+    if not down_xs or not up_xs:
+        return []
+
+    # Ties in X keep their original order, so the first in-window candidate
+    # at a given X is also the lowest up index at that X.
+    up_order = sorted(range(len(up_xs)), key=up_xs.__getitem__)
+    sorted_up_xs = [up_xs[i] for i in up_order]
+    n_up = len(up_order)
+    # Widen the window so float rounding at the edges cannot drop a
+    # candidate; the exact tolerance check below decides the match.
+    reach = 2 * tol
+
+    pairs = []
+    lo = 0
+    for di in sorted(range(len(down_xs)), key=down_xs.__getitem__):
+        x = down_xs[di]
+        while lo < n_up and sorted_up_xs[lo] < x - reach:
+            lo += 1
+        best = -1
+        j = lo
+        while j < n_up and sorted_up_xs[j] <= x + reach:
+            ui = up_order[j]
+            if abs(x - up_xs[ui]) < tol and (best < 0 or ui < best):
+                best = ui
+            j += 1
+        if best >= 0:
+            pairs.append((di, best))
+    return pairs
 
 
 def _find_matching_ports(
     down_ports: list[Port], up_ports: list[Port]
 ) -> list[tuple[Port, Port]]:
-    """Pair up downward ports with upward ports based on X position."""
-    pairs = []
-    # Sort downward ports by X position for consistent ordering
-    sorted_down = sorted(down_ports, key=lambda p: p.position.x)
-
-    for dp in sorted_down:
-        # Find matching upward port
-        for up in up_ports:
-            if abs(dp.position.x - up.position.x) < DEFAULT_WIRE_ALIGNMENT_TOLERANCE:
-                pairs.append((dp, up))
-                break
-    return pairs
+    """Pair up downward ports with upward ports based on X position.
+
+    Each downward port (in X order) is paired with the first upward port, in
+    list order, whose X lies within ``DEFAULT_WIRE_ALIGNMENT_TOLERANCE``.
+    """
+    index_pairs = _match_xs(
+        [p.position.x for p in down_ports],
+        [p.position.x for p in up_ports],
+        DEFAULT_WIRE_ALIGNMENT_TOLERANCE,
+    )
+    return [(down_ports[di], up_ports[ui]) for di, ui in index_pairs]
+
+
+# Shared (color, size) label for wires without a specification.
+_EMPTY_SPEC: tuple[str, str] = ("", "")
+
+
+def _no_spec(dp: Port, match_index: int) -> tuple[str, str]:
+    """Spec lookup used when no usable wire specification exists."""
+    return _EMPTY_SPEC
+
+
+@singledispatch
+def _make_spec_lookup(
+    wire_specs: dict[str, tuple] | list[tuple] | None,
+) -> Callable[[Port, int], tuple[str, str]]:
+    """Inspect *wire_specs* once and return a ``(port, match_index)`` lookup.
+
+    The returned callable yields the (color, size) label for a wire, or
+    ``("", "")`` when no usable spec exists.  Dispatches on the type of
+    *wire_specs*; ``None`` and unsupported types get :func:`_no_spec`.
+    """
+    return _no_spec
+
+
+@_make_spec_lookup.register
+def _(wire_specs: list) -> Callable[[Port, int], tuple[str, str]]:
+    if not wire_specs:
+        return _no_spec
+    count = len(wire_specs)
+
+    def by_index(dp: Port, match_index: int) -> tuple[str, str]:
+        if match_index >= count:
+            return _EMPTY_SPEC
+        spec = wire_specs[match_index]
+        return spec if isinstance(spec, tuple) else _EMPTY_SPEC
+
+    return by_index
+
+
+@_make_spec_lookup.register
+def _(wire_specs: dict) -> Callable[[Port, int], tuple[str, str]]:
+    if not wire_specs:
+        return _no_spec
+
+    def by_port_id(dp: Port, match_index: int) -> tuple[str, str]:
+        spec = wire_specs.get(dp.id, _EMPTY_SPEC)
+        return spec if isinstance(spec, tuple) else _EMPTY_SPEC
+
+    return by_port_id
 
 
 def _get_wire_label_spec(
@@ -98,18 +217,8 @@ def _get_wire_label_spec(
     match_index: int,
     wire_specs: dict[str, tuple] | list[tuple] | None,
 ) -> tuple[str, str]:
-    """Determine the label (color, size) for a wire."""
-    if not wire_specs:
-        return ("", "")
-
-    spec = ("", "")
-    if isinstance(wire_specs, list):
-        if match_index < len(wire_specs):
-            spec = wire_specs[match_index]
-    elif isinstance(wire_specs, dict):
-        spec = wire_specs.get(dp.id, ("", ""))
-
-    return spec if isinstance(spec, tuple) else ("", "")
+    """Determine the label (color, size) for a single wire."""
+    return _make_spec_lookup(wire_specs)(dp, match_index)
 
 
 def auto_connect_labeled(
@@ -141,20 +250,31 @@ def auto_connect_labeled(
     from .wire_labels import create_labeled_wire
 
     elements = []
-    wire_specs = wire_specs or {}
 
     # Get ports
-    down_ports = get_connection_ports(sym1, Vector(0, 1))
-    up_ports = get_connection_ports(sym2, Vector(0, -1))
-
-    # Match ports
+    down_ports = sym1.down_ports
+    if not down_ports:
+        return []
+    up_ports = sym2.up_ports
+    if not up_ports:
+        return []
+
+    # Match ports on the symbols' cached X arrays.
     # Note: Matching logic implies we iterate down_ports
     # in sorted order and find 'up' match
-    port_pairs = _find_matching_ports(down_ports, up_ports)
+    port_pairs = [
+        (down_ports[di], up_ports[ui])
+        for di, ui in _match_xs(
+            sym1.down_xs, sym2.up_xs, DEFAULT_WIRE_ALIGNMENT_TOLERANCE
+        )
+    ]
+
+    # Resolve the wire_specs shape once, not per wire
+    spec_for = _make_spec_lookup(wire_specs)
 
     for i, (dp, matched_up) in enumerate(port_pairs):
         # Determine label spec
-        color, size = _get_wire_label_spec(dp, i, wire_specs)
+        color, size = spec_for(dp, i)
 
         # Create labeled wire
         wire_elements = create_labeled_wire(
@@ -179,29 +299,27 @@ def layout_vertical_chain(
     Returns:
         list[Element]: List of Elements (Placed Symbols and Connecting Lines).
     """
-    elements = []
-    placed_symbols = []
+    placed_symbols: list[Element] = []
+    lines: list[Element] = []
 
     current_x = start.x
     current_y = start.y
+    previous: Symbol | None = None
 
+    # Place and connect in one pass: each symbol is wired to the one above it
+    # as soon as it is placed.  Lines are collected separately so the result
+    # still lists all symbols before all connections.
     for sym in symbols:
         placed = translate(sym, current_x, current_y)
-
         placed_symbols.append(placed)
-        elements.append(placed)
-
-        current_y += spacing
 
-    # Connect them
-    for i in range(len(placed_symbols) - 1):
-        top = placed_symbols[i]
-        bot = placed_symbols[i + 1]
+        if previous is not None:
+            lines.extend(auto_connect(previous, placed))
+        previous = placed
 
-        lines = auto_connect(top, bot)
-        elements.extend(lines)
+        current_y += spacing
 
-    return elements
+    return placed_symbols + lines
 
 
 # --- Horizontal Flow Helpers ---
@@ -233,16 +351,41 @@ def layout_horizontal(
     Returns:
         tuple[dict[str, Any], list[Element]]: Final state and list of all elements.
     """
-    current_state = start_state
-    all_elements = []
+    run = _make_horizontal_layout(count, spacing)
+    return run(start_state, start_x, start_y, generate_func)
+
+
+@lru_cache(maxsize=32, typed=True)
+def _make_horizontal_layout(
+    count: int, spacing: float
+) -> Callable[
+    [Any, float, float, Callable[[Any, float, float], tuple[Any, list[Element]]]],
+    tuple[Any, list[Element]],
+]:
+    """Build a ``layout_horizontal`` runner specialised for *count*/*spacing*.
+
+    The per-copy offsets are computed once and captured, so repeated layouts
+    with the same row shape (e.g. every breaker on a busbar) reuse them.
+    The cache is typed: ``10`` and ``10.0`` must not share offsets, since the
+    int/float type of each X ends up in the rendered SVG.
+    """
+    offsets = tuple(i * spacing for i in range(count))
 
-    for i in range(count):
-        x_pos = start_x + (i * spacing)
-        # Pass current_state, receive new state
-        current_state, elems = generate_func(current_state, x_pos, start_y)
-        all_elements.extend(elems)
+    def run(
+        state: Any,
+        start_x: float,
+        start_y: float,
+        generate_func: Callable[[Any, float, float], tuple[Any, list[Element]]],
+    ) -> tuple[Any, list[Element]]:
+        all_elements: list[Element] = []
+        extend = all_elements.extend
+        for dx in offsets:
+            # Pass state, receive new state
+            state, elems = generate_func(state, start_x + dx, start_y)
+            extend(elems)
+        return state, all_elements
 
-    return current_state, all_elements
+    return run
 
 
 def create_horizontal_layout(
@@ -306,7 +449,8 @@ def create_horizontal_layout(
         gens.update(tag_generators)
 
     current_state = state
-    all_elements = []
+    all_elements: list[Element] = []
+    extend = all_elements.extend
 
     for i in range(count):
         x_pos = start_x + (i * spacing)
@@ -314,6 +458,6 @@ def create_horizontal_layout(
         current_state, elems = generator_func_single(
             current_state, x_pos, start_y, gens, tm, i
         )
-        all_elements.extend(elems)
+        extend(elems)
 
     return current_state, all_elements
@@ -1,8 +1,10 @@
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import cached_property
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Vector:
     """
     An immutable vector representing direction and magnitude in 2D space.
@@ -26,11 +28,15 @@ class Vector:
         return Vector(self.dx * scalar, self.dy * scalar)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     """
     An immutable point in 2D space.
 
+    Slotted, like the other small value types in this module (Vector, Style,
+    Port): every wire, port and text anchor holds Points, so they carry no
+    per-instance ``__dict__``.
+
     Attributes:
         x (float): The x-coordinate.
         y (float): The y-coordinate.
@@ -74,7 +80,7 @@ class Point:
         raise TypeError(f"Can only subtract Point from Point, got {type(other)}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Style:
     """
     Style attributes for SVG elements.
@@ -96,6 +102,11 @@ class Style:
     font_family: str | None = None
 
 
+# Shared default Style.  Style is frozen, so every primitive created without
+# an explicit style references this one instance (flyweight).
+_DEFAULT_STYLE = Style()
+
+
 @dataclass(frozen=True)
 class Element:
     """Base class for all geometric primitives and symbols."""
@@ -103,7 +114,7 @@ class Element:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Port:
     """
     A connection point on a symbol.
@@ -135,6 +146,94 @@ class Symbol(Element):
     ports: dict[str, Port]
     label: str | None = None
 
+    def ports_facing(self, direction: Vector) -> list[Port]:
+        """
+        Find all ports whose direction matches *direction*.
+
+        Ports that share a position with an earlier match (e.g. aliased
+        ports) are skipped.  Axis-aligned unit directions are served from
+        the cached per-direction buckets; any other direction is scanned.
+
+        Args:
+            direction (Vector): The direction vector to match.
+
+        Returns:
+            list[Port]: Matching ports in ``ports`` order.
+        """
+        key = (direction.dx, direction.dy)
+        if key in _AXIS_DIRECTIONS:
+            return list(self._ports_by_direction[key])
+        return _scan_ports_facing(self.ports.values(), direction.dx, direction.dy)
+
+    # The properties below are derived from ``ports`` on first access and
+    # cached on the instance.  Symbols are immutable, so ``ports`` must not be
+    # mutated after they have been read.
+
+    @cached_property
+    def _ports_by_direction(self) -> dict[tuple[int, int], tuple[Port, ...]]:
+        """Ports bucketed by axis-aligned unit direction.
+
+        Each port is classified once by rounding its direction to the nearest
+        axis key; ports that are not within tolerance of any key are left out.
+        """
+        grouped: dict[tuple[int, int], list[Port]] = {d: [] for d in _AXIS_DIRECTIONS}
+        for p in self.ports.values():
+            d = p.direction
+            key = (round(d.dx), round(d.dy))
+            bucket = grouped.get(key)
+            if bucket is not None:
+                bucket.append(p)
+        return {
+            key: tuple(_scan_ports_facing(ports, key[0], key[1]))
+            for key, ports in grouped.items()
+        }
+
+    @cached_property
+    def down_ports(self) -> tuple[Port, ...]:
+        """Ports facing down (0, 1), used as wire sources by auto-connect."""
+        return self._ports_by_direction[(0, 1)]
+
+    @cached_property
+    def up_ports(self) -> tuple[Port, ...]:
+        """Ports facing up (0, -1), used as wire targets by auto-connect."""
+        return self._ports_by_direction[(0, -1)]
+
+    @cached_property
+    def down_xs(self) -> array:
+        """X coordinates of :attr:`down_ports` as a contiguous float array."""
+        return array("d", (p.position.x for p in self.down_ports))
+
+    @cached_property
+    def up_xs(self) -> array:
+        """X coordinates of :attr:`up_ports` as a contiguous float array."""
+        return array("d", (p.position.x for p in self.up_ports))
+
+
+# Axis-aligned unit directions that Symbol buckets its ports by.
+_AXIS_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+def _scan_ports_facing(
+    ports: Iterable[Port], target_dx: float, target_dy: float
+) -> list[Port]:
+    """Filter *ports* by direction, skipping spatially coincident duplicates."""
+    matches: list[Port] = []
+    seen_positions: set[tuple[float, float]] = set()
+
+    # Single pass; the dy test only runs for ports whose dx already matches.
+    for p in ports:
+        d = p.direction
+        if abs(d.dx - target_dx) < 1e-6 and abs(d.dy - target_dy) < 1e-6:
+            # Check for spatial duplicates
+            # (e.g. aliased ports pointing to same location)
+            pos_key = (round(p.position.x, 4), round(p.position.y, 4))
+
+            if pos_key not in seen_positions:
+                matches.append(p)
+                seen_positions.add(pos_key)
+
+    return matches
+
 
 # Type alias for symbol factory functions.
 # A SymbolFactory is any callable that accepts a tag string as its first
@@ -12,6 +12,7 @@ All constants are imported from the constants module.
 """
 
 from dataclasses import replace
+from functools import cache
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
@@ -40,10 +41,14 @@ from .core import Point, Style, Symbol
 from .primitives import Circle, Element, Polygon, Text
 
 
+@cache
 def standard_style(filled: bool = False) -> Style:
     """
     Create a standard style for symbols.
 
+    Style is frozen, so one shared instance per ``filled`` value is returned
+    instead of allocating a new Style for every line or shape.
+
     Args:
         filled (bool): Whether the element should be filled (black) or not (none).
 
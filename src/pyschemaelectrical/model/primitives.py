@@ -8,7 +8,7 @@ All primitives are immutable dataclasses that inherit from Element.
 
 from dataclasses import dataclass
 
-from .core import Element, Point, Style
+from .core import _DEFAULT_STYLE, Element, Point, Style
 
 
 @dataclass(frozen=True)
@@ -24,7 +24,7 @@ class Line(Element):
 
     start: Point
     end: Point
-    style: Style = Style()
+    style: Style = _DEFAULT_STYLE
 
 
 @dataclass(frozen=True)
@@ -40,7 +40,7 @@ class Circle(Element):
 
     center: Point
     radius: float
-    style: Style = Style()
+    style: Style = _DEFAULT_STYLE
 
 
 @dataclass(frozen=True)
@@ -62,7 +62,7 @@ class Text(Element):
 
     content: str
     position: Point
-    style: Style = Style()
+    style: Style = _DEFAULT_STYLE
     anchor: str = "middle"
     dominant_baseline: str = "auto"
     font_size: float = 12.0
@@ -80,7 +80,7 @@ class Path(Element):
     """
 
     d: str
-    style: Style = Style()
+    style: Style = _DEFAULT_STYLE
 
 
 @dataclass(frozen=True)
@@ -108,4 +108,4 @@ class Polygon(Element):
     """
 
     points: list[Point]
-    style: Style = Style()
+    style: Style = _DEFAULT_STYLE
@@ -16,7 +16,9 @@ from __future__ import annotations
 import re
 import warnings
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from pyschemaelectrical.field_devices import ConnectionRow
@@ -31,7 +33,7 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlcModuleType:
     """
     Hardware definition for a PLC I/O module.
@@ -50,6 +52,15 @@ class PlcModuleType:
     label_format: str = "{suffix}{channel}"
 
 
+# Natural sort key cached per string: rows on one terminal strip (and all
+# pins of one component) share a tag, so most keys repeat.  The cached
+# lists are only ever compared, never mutated.
+_sort_key = lru_cache(maxsize=1024)(natural_sort_key)
+
+# Splits a designation's type from its trailing instance number ("DO1").
+_MATCH_TYPE_AND_NUM = re.compile(r"([A-Za-z\-]+)(\d+)?$").match
+
+
 PlcRack = list[tuple[str, PlcModuleType]]
 """
 A physical PLC rack: ordered list of (designation, module_type) pairs.
@@ -66,7 +77,7 @@ Example::
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlcDesignation:
     """
     Parsed representation of a PLC tag string.
@@ -108,21 +119,7 @@ class PlcDesignation:
         """
         if not tag.startswith("PLC:"):
             return None
-        rest = tag[4:]  # strip "PLC:"
-        parts = rest.split(":", 1)
-        type_and_num = parts[0]
-        signal = parts[1] if len(parts) > 1 else None
-
-        # Split trailing digits from the type string
-        m = re.match(r"^([A-Za-z\-]+)(\d+)?$", type_and_num)
-        if m:
-            plc_type = m.group(1)
-            instance = int(m.group(2)) if m.group(2) else None
-        else:
-            plc_type = type_and_num
-            instance = None
-
-        return cls(type=plc_type, instance=instance, signal=signal)
+        return _parse_designation(cls, tag)
 
     def __str__(self) -> str:
         """Return the canonical tag string for this designation."""
@@ -134,6 +131,31 @@ class PlcDesignation:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=512)
+def _parse_designation(cls: type[PlcDesignation], tag: str) -> PlcDesignation:
+    """
+    Build the designation for a ``"PLC:..."`` tag, cached per class and tag.
+
+    A project only uses a handful of distinct tags, and designations are
+    frozen, so repeated parses can share one instance.
+    """
+    rest = tag[4:]  # strip "PLC:"
+    parts = rest.split(":", 1)
+    type_and_num = parts[0]
+    signal = parts[1] if len(parts) > 1 else None
+
+    # Split trailing digits from the type string
+    m = _MATCH_TYPE_AND_NUM(type_and_num)
+    if m:
+        plc_type = m.group(1)
+        instance = int(m.group(2)) if m.group(2) else None
+    else:
+        plc_type = type_and_num
+        instance = None
+
+    return cls(type=plc_type, instance=instance, signal=signal)
+
+
 def _parse_plc_tag(terminal_tag: str) -> tuple[str, str]:
     """
     Parse a PLC terminal tag into (base_type, pin_suffix).
@@ -147,9 +169,37 @@ def _parse_plc_tag(terminal_tag: str) -> tuple[str, str]:
     return parts[0], parts[1] if len(parts) > 1 else ""
 
 
+_RackIndex = tuple[
+    dict[str, list[tuple[str, PlcModuleType]]],
+    dict[str, list[tuple[str, PlcModuleType]]],
+]
+
+
+def _index_rack(rack: PlcRack) -> _RackIndex:
+    """
+    Bucket rack modules by designation prefix and by signal type.
+
+    Built once per resolver call so each PLC type lookup is a dict hit
+    instead of two scans of the rack. Buckets keep rack order.
+
+    Args:
+        rack: The rack to index.
+
+    Returns:
+        A ``(by_prefix, by_signal_type)`` pair of dicts.
+    """
+    by_prefix: dict[str, list[tuple[str, PlcModuleType]]] = defaultdict(list)
+    by_signal_type: dict[str, list[tuple[str, PlcModuleType]]] = defaultdict(list)
+    for des, mod in rack:
+        by_prefix[des.rstrip("0123456789")].append((des, mod))
+        by_signal_type[mod.signal_type].append((des, mod))
+    return by_prefix, by_signal_type
+
+
 def _find_modules_for_type(
     plc_type: str,
     rack: PlcRack,
+    index: _RackIndex | None = None,
 ) -> list[tuple[str, PlcModuleType]]:
     """
     Find PLC rack modules matching a PLC type string.
@@ -160,14 +210,14 @@ def _find_modules_for_type(
     Args:
         plc_type: The PLC type string to look up (e.g. "DI", "RTD", "4-20mA").
         rack: The rack to search.
+        index: Precomputed :func:`_index_rack` result for *rack*; built on
+            the fly when omitted.
 
     Returns:
         List of (designation, module_type) pairs from the rack that match.
     """
-    modules = [(des, mod) for des, mod in rack if des.rstrip("0123456789") == plc_type]
-    if modules:
-        return modules
-    return [(des, mod) for des, mod in rack if mod.signal_type == plc_type]
+    by_prefix, by_signal_type = index if index is not None else _index_rack(rack)
+    return list(by_prefix.get(plc_type) or by_signal_type.get(plc_type, ()))
 
 
 def _get_used_channels(connections: list[ConnectionRow]) -> set[tuple[str, int]]:
@@ -191,7 +241,7 @@ def _get_used_channels(connections: list[ConnectionRow]) -> set[tuple[str, int]]
             continue
         designation = comp_to[4:]
         # Only count specific designations (with digits), not reference tags
-        if not any(c.isdigit() for c in designation):
+        if not any(map(str.isdigit, designation)):
             continue
         pin_label = row[5]
         channel = "".join(c for c in pin_label if c.isdigit())
@@ -200,6 +250,33 @@ def _get_used_channels(connections: list[ConnectionRow]) -> set[tuple[str, int]]
     return used
 
 
+def _free_slots(
+    modules: list[tuple[str, PlcModuleType]],
+    used_channels: set[tuple[str, int]] | None = None,
+) -> list[tuple[str, PlcModuleType, int]]:
+    """
+    List the free channels of *modules* in rack order.
+
+    Each slot carries its ready-made ``"PLC:{designation}"`` target tag,
+    built once per module rather than once per assigned row.
+
+    Args:
+        modules: List of (designation, module_type) pairs to fill.
+        used_channels: Set of (designation, channel) tuples already occupied.
+
+    Returns:
+        List of ``(target_tag, module_type, channel)`` tuples.
+    """
+    used_channels = used_channels or set()
+    free_slots: list[tuple[str, PlcModuleType, int]] = []
+    for des, mod in modules:
+        target = f"PLC:{des}"
+        for ch in range(1, mod.channels + 1):
+            if (des, ch) not in used_channels:
+                free_slots.append((target, mod, ch))
+    return free_slots
+
+
 def _assign_connections_to_modules(
     conns: list[Any],
     modules: list[tuple[str, PlcModuleType]],
@@ -220,21 +297,14 @@ def _assign_connections_to_modules(
     Returns:
         List of ConnectionRow tuples mapping components to PLC pins.
     """
-    used_channels = used_channels or set()
-    conns.sort(key=lambda c: natural_sort_key(c.component_tag))
+    conns.sort(key=lambda c: _sort_key(c.component_tag))
 
-    free_slots: list[tuple[str, PlcModuleType, int]] = []
-    for des, mod in modules:
-        for ch in range(1, mod.channels + 1):
-            if (des, ch) not in used_channels:
-                free_slots.append((des, mod, ch))
+    free_slots = _free_slots(modules, used_channels)
 
     rows: list[ConnectionRow] = []
-    for conn, (des, mod, ch) in zip(conns, free_slots, strict=False):
+    for conn, (target, mod, ch) in zip(conns, free_slots, strict=False):
         pin_label = mod.label_format.format(suffix=mod.pins_per_channel[0], channel=ch)
-        rows.append(
-            (conn.component_tag, conn.component_pin, "", "", f"PLC:{des}", pin_label)
-        )
+        rows.append((conn.component_tag, conn.component_pin, "", "", target, pin_label))
 
     if len(conns) > len(free_slots):
         overflow = len(conns) - len(free_slots)
@@ -268,8 +338,6 @@ def _assign_multi_pin_connections(
     Returns:
         List of ConnectionRow tuples mapping components to PLC pins.
     """
-    used_channels = used_channels or set()
-
     # Filter to modules whose pins match the required suffixes
     required_suffixes = {suffix for _, suffix in conn_pairs if suffix}
     compatible_modules = [
@@ -283,33 +351,22 @@ def _assign_multi_pin_connections(
     for conn, suffix in conn_pairs:
         by_component[conn.component_tag].append((conn, suffix))
 
-    sorted_components = sorted(by_component.keys(), key=natural_sort_key)
+    sorted_components = sorted(by_component.keys(), key=_sort_key)
 
-    free_slots: list[tuple[str, PlcModuleType, int]] = []
-    for des, mod in compatible_modules:
-        for ch in range(1, mod.channels + 1):
-            if (des, ch) not in used_channels:
-                free_slots.append((des, mod, ch))
+    free_slots = _free_slots(compatible_modules, used_channels)
 
     rows: list[ConnectionRow] = []
     slot_idx = 0
     for comp_tag in sorted_components:
         if slot_idx >= len(free_slots):
             break
-        des, mod, ch = free_slots[slot_idx]
+        target, mod, ch = free_slots[slot_idx]
         slot_idx += 1
 
         for conn, suffix in by_component[comp_tag]:
             pin_label = mod.label_format.format(suffix=suffix, channel=ch)
             rows.append(
-                (
-                    conn.component_tag,
-                    conn.component_pin,
-                    "",
-                    "",
-                    f"PLC:{des}",
-                    pin_label,
-                )
+                (conn.component_tag, conn.component_pin, "", "", target, pin_label)
             )
 
     overflow = len(sorted_components) - slot_idx
@@ -340,19 +397,14 @@ def _resolve_single_pin_external(
     Returns:
         List of ConnectionRow tuples with resolved PLC designations.
     """
-    entries.sort(
-        key=lambda e: (natural_sort_key(str(e[0][2])), natural_sort_key(e[0][3]))
-    )
+    entries.sort(key=lambda e: (_sort_key(str(e[0][2])), _sort_key(e[0][3])))
 
-    free_slots: list[tuple[str, PlcModuleType, int]] = []
-    for des, mod in modules:
-        for ch in range(1, mod.channels + 1):
-            free_slots.append((des, mod, ch))
+    free_slots = _free_slots(modules)
 
     rows: list[ConnectionRow] = []
-    for (row, _), (des, mod, ch) in zip(entries, free_slots, strict=False):
+    for (row, _), (target, mod, ch) in zip(entries, free_slots, strict=False):
         pin_label = mod.label_format.format(suffix=mod.pins_per_channel[0], channel=ch)
-        rows.append((row[0], row[1], row[2], row[3], f"PLC:{des}", pin_label))
+        rows.append((row[0], row[1], row[2], row[3], target, pin_label))
 
     if len(entries) > len(free_slots):
         overflow = len(entries) - len(free_slots)
@@ -398,27 +450,23 @@ def _resolve_multi_pin_external(
     sorted_components = sorted(
         by_component.keys(),
         key=lambda tag: min(
-            (natural_sort_key(str(row[2])), natural_sort_key(row[3]))
-            for row, _ in by_component[tag]
+            (_sort_key(str(row[2])), _sort_key(row[3])) for row, _ in by_component[tag]
         ),
     )
 
-    free_slots: list[tuple[str, PlcModuleType, int]] = []
-    for des, mod in compatible_modules:
-        for ch in range(1, mod.channels + 1):
-            free_slots.append((des, mod, ch))
+    free_slots = _free_slots(compatible_modules)
 
     rows: list[ConnectionRow] = []
     slot_idx = 0
     for comp_tag in sorted_components:
         if slot_idx >= len(free_slots):
             break
-        des, mod, ch = free_slots[slot_idx]
+        target, mod, ch = free_slots[slot_idx]
         slot_idx += 1
 
         for row, suffix in by_component[comp_tag]:
             pin_label = mod.label_format.format(suffix=suffix, channel=ch)
-            rows.append((row[0], row[1], row[2], row[3], f"PLC:{des}", pin_label))
+            rows.append((row[0], row[1], row[2], row[3], target, pin_label))
 
     overflow = len(sorted_components) - slot_idx
     if overflow > 0:
@@ -463,24 +511,27 @@ def resolve_plc_references(
     """
     resolved: list[ConnectionRow] = []
     unresolved_by_type: dict[str, list[tuple[ConnectionRow, str]]] = defaultdict(list)
+    # Bound once: this loop runs for every connection row of the project.
+    keep = resolved.append
 
     for row in connections:
         comp_to = row[4]
         if not comp_to or not comp_to.startswith("PLC:"):
-            resolved.append(row)
+            keep(row)
             continue
 
         base_type, pin_suffix = _parse_plc_tag(comp_to)
 
         # Already a specific designation (has digits like "AI1", "DI2")
-        if any(c.isdigit() for c in base_type):
-            resolved.append(row)
+        if any(map(str.isdigit, base_type)):
+            keep(row)
             continue
 
         unresolved_by_type[base_type].append((row, pin_suffix))
 
+    rack_index = _index_rack(rack)
     for plc_type, entries in unresolved_by_type.items():
-        modules = _find_modules_for_type(plc_type, rack)
+        modules = _find_modules_for_type(plc_type, rack, rack_index)
 
         if not modules:
             for row, _ in entries:
@@ -546,8 +597,9 @@ def extract_plc_connections_from_registry(
 
     rows: list[ConnectionRow] = []
 
+    rack_index = _index_rack(rack)
     for plc_type, conn_pairs in plc_by_type.items():
-        modules = _find_modules_for_type(plc_type, rack)
+        modules = _find_modules_for_type(plc_type, rack, rack_index)
 
         if not modules:
             continue
@@ -584,6 +636,28 @@ def generate_plc_report_rows(
     Returns:
         List of ``(Module, MPN, PLC Pin, Component, Pin, Terminal)`` tuples.
     """
+    return list(iter_plc_report_rows(connections, rack))
+
+
+def iter_plc_report_rows(
+    connections: list[ConnectionRow],
+    rack: PlcRack,
+) -> Iterator[tuple[str, str, str, str, str, str]]:
+    """
+    Yield PLC connection table rows one at a time.
+
+    Streaming form of :func:`generate_plc_report_rows`, for consumers such
+    as a CSV writer that never need the whole table in memory. The
+    connections are indexed once, up front, when iteration starts.
+
+    Args:
+        connections: All PLC connections (external + registry), with resolved
+            designations (e.g. ``"PLC:DO1"``).
+        rack: The PLC rack to generate the report for.
+
+    Yields:
+        ``(Module, MPN, PLC Pin, Component, Pin, Terminal)`` tuples.
+    """
     plc_conns: dict[tuple[str, str], ConnectionRow] = {}
     for row in connections:
         _from_comp, _from_pin, _terminal, _terminal_pin, to, to_pin = row
@@ -591,39 +665,26 @@ def generate_plc_report_rows(
             designation = to[4:]
             plc_conns[(designation, to_pin)] = row
 
-    rows: list[tuple[str, str, str, str, str, str]] = []
-
     for designation, module_type in rack:
+        # Per-module invariants, hoisted out of the channel x pin loops
+        mpn = module_type.mpn
+        label = module_type.label_format.format
+        pins = module_type.pins_per_channel
         for ch in range(1, module_type.channels + 1):
-            for pin_suffix in module_type.pins_per_channel:
-                pin_label = module_type.label_format.format(
-                    suffix=pin_suffix, channel=ch
-                )
+            for pin_suffix in pins:
+                pin_label = label(suffix=pin_suffix, channel=ch)
                 conn = plc_conns.get((designation, pin_label))
 
                 if conn:
                     from_comp, from_pin, terminal, terminal_pin, _, _ = conn
                     terminal_str = f"{terminal}:{terminal_pin}" if terminal else ""
-                    rows.append(
-                        (
-                            designation,
-                            module_type.mpn,
-                            pin_label,
-                            from_comp,
-                            from_pin,
-                            terminal_str,
-                        )
+                    yield (
+                        designation,
+                        mpn,
+                        pin_label,
+                        from_comp,
+                        from_pin,
+                        terminal_str,
                     )
                 else:
-                    rows.append(
-                        (
-                            designation,
-                            module_type.mpn,
-                            pin_label,
-                            "",
-                            "",
-                            "",
-                        )
-                    )
-
-    return rows
+                    yield (designation, mpn, pin_label, "", "", "")
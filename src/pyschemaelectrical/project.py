@@ -1323,7 +1323,7 @@ class Project:
 
         from pyschemaelectrical.plc_resolver import (
             extract_plc_connections_from_registry,
-            generate_plc_report_rows,
+            iter_plc_report_rows,
             resolve_plc_references,
         )
 
@@ -1343,7 +1343,7 @@ class Project:
 
         # Merge and generate rows
         all_connections = external + registry_connections
-        rows = generate_plc_report_rows(all_connections, rack)
+        rows = iter_plc_report_rows(all_connections, rack)
 
         with open(csv_path, "w", newline="") as f:
             writer = _csv.writer(f)
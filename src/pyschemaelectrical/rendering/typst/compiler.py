@@ -261,11 +261,10 @@ class TypstCompiler:
 )
 """
 
-        # Append pages
-        for page in self._pages:
-            content += self._render_page(page)
-
-        return content
+        # Append pages: render each once, then join into a single buffer
+        parts = [content]
+        parts.extend(self._render_page(page) for page in self._pages)
+        return "".join(parts)
 
     def _render_page(self, page: _Page) -> str:
         """Render a single page to Typst markup."""
@@ -4,6 +4,14 @@ Simple Markdown to Typst converter for front pages.
 Supports headings (# ## ###), tables (| col | col |), and paragraphs.
 """
 
+# Typst output fragments, indexed by Markdown heading level (1-3).
+_HEADING_PREFIX: tuple[str, ...] = ("",) + tuple(
+    "    " + "=" * level + " " for level in range(1, 4)
+)
+_HEADING_GAP: tuple[str, ...] = ("", r"    #v(1em)", r"    #v(0.5em)", r"    #v(0.5em)")
+_PARBREAK = r"    #parbreak()"
+_PAGEBREAK = "#pagebreak()"
+
 
 def markdown_to_typst(
     md_path: str,
@@ -29,18 +37,20 @@ def markdown_to_typst(
     """
     try:
         with open(md_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            text = f.read()
     except FileNotFoundError:
         print(f"Warning: {md_path} not found, skipping front page.")
         return ""
 
-    typst_lines, extracted_notice = _convert_lines(lines, width)
+    # One read, one split.  Text mode already normalised line endings, and
+    # split("\n") (unlike splitlines) keeps form feeds etc. inside a line.
+    typst_lines, extracted_notice = _convert_lines(text.split("\n"), width)
 
     effective_notice = notice if notice is not None else extracted_notice
     if effective_notice:
         typst_lines.append(_notice_block(effective_notice, width))
 
-    typst_lines.append("#pagebreak()")
+    typst_lines.append(_PAGEBREAK)
     return "\n".join(typst_lines)
 
 
@@ -51,9 +61,10 @@ def _convert_lines(lines: list[str], width: str) -> tuple[list[str], str | None]
     contains a ``## Notice`` section, its body text is extracted and
     returned separately (not rendered inline).
     """
-    typst_lines = []
-    typst_lines.append(r"#align(center + horizon)[")
-    typst_lines.append(f"  #block(width: {width})[")
+    typst_lines = [r"#align(center + horizon)[", f"  #block(width: {width})["]
+    # Bound once: these run for every line of every converted file.
+    emit = typst_lines.append
+    emit_all = typst_lines.extend
 
     in_table = False
     table_rows: list[str] = []
@@ -64,33 +75,34 @@ def _convert_lines(lines: list[str], width: str) -> tuple[list[str], str | None]
         line = line.strip()
         if not line:
             if in_table:
-                typst_lines.extend(_flush_table(table_rows))
+                emit_all(_flush_table(table_rows))
                 in_table = False
                 table_rows = []
             continue
 
-        if line.startswith("# "):
-            typst_lines.append(f"    = {line[2:]}")
-            typst_lines.append(r"    #v(1em)")
+        startswith = line.startswith
+        if startswith("# "):
+            emit(_HEADING_PREFIX[1] + line[2:])
+            emit(_HEADING_GAP[1])
         elif line.lower() == "## notice":
             in_notice = True
-        elif line.startswith("## "):
+        elif startswith("## "):
             in_notice = False
-            typst_lines.append(f"    == {line[3:]}")
-            typst_lines.append(r"    #v(0.5em)")
+            emit(_HEADING_PREFIX[2] + line[3:])
+            emit(_HEADING_GAP[2])
         elif in_notice:
             notice_parts.append(line)
-        elif line.startswith("### "):
-            typst_lines.append(f"    === {line[4:]}")
-            typst_lines.append(r"    #v(0.5em)")
-        elif line.startswith("|"):
+        elif startswith("### "):
+            emit(_HEADING_PREFIX[3] + line[4:])
+            emit(_HEADING_GAP[3])
+        elif startswith("|"):
             if "---" in line:
                 continue  # Skip table separator rows
             in_table = True
             table_rows.append(line)
         else:
-            typst_lines.append(f"    {line}")
-            typst_lines.append(r"    #parbreak()")
+            emit(f"    {line}")
+            emit(_PARBREAK)
 
     if in_table:
         typst_lines.extend(_flush_table(table_rows))
@@ -107,19 +119,19 @@ def _flush_table(rows: list[str]) -> list[str]:
     if not rows:
         return []
 
+    # Split every row into its non-empty cells once
+    row_cells = [[c for c in map(str.strip, row.split("|")) if c] for row in rows]
+
     # Determine column count from first row
-    first_cols = [c.strip() for c in rows[0].split("|") if c.strip()]
-    num_cols = max(len(first_cols), 1)
+    num_cols = max(len(row_cells[0]), 1)
 
     result = []
     result.append(f"    #table(columns: {num_cols}, stroke: 0.5pt, inset: 5pt,")
     col_aligns = ", ".join(["left"] * num_cols)
     result.append(f"      align: ({col_aligns}),")
 
-    for row in rows:
-        cols = [c.strip() for c in row.split("|") if c.strip()]
-        for col in cols:
-            result.append(f"      [{col}],")
+    for cells in row_cells:
+        result.extend(f"      [{col}]," for col in cells)
 
     result.append("    )")
     return result
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from itertools import pairwise
 
 from pyschemaelectrical.layout.layout import auto_connect
 from pyschemaelectrical.model.core import Element, Symbol
@@ -70,18 +71,14 @@ def auto_connect_circuit(circuit: Circuit) -> None:
     Automatically connect all adjacent connectable symbols in the circuit.
 
     Iterates through the symbols in the order they were added and connects
-    each symbol to the next one using auto_connect logic.
+    each symbol to the next one using auto_connect logic. Only consecutive
+    pairs are visited, so the walk is linear in the number of symbols.
 
     Args:
         circuit (Circuit): The circuit to process.
     """
-    connectable_symbols = circuit.symbols
-
-    for i in range(len(connectable_symbols) - 1):
-        s1 = connectable_symbols[i]
-        s2 = connectable_symbols[i + 1]
-        lines = auto_connect(s1, s2)
-        circuit.elements.extend(lines)
+    for s1, s2 in pairwise(circuit.symbols):
+        circuit.elements.extend(auto_connect(s1, s2))
 
 
 def render_system(
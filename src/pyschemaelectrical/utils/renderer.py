@@ -5,7 +5,7 @@ from pyschemaelectrical.model.constants import (
     DEFAULT_DOC_HEIGHT,
     DEFAULT_DOC_WIDTH,
 )
-from pyschemaelectrical.model.core import Style, Symbol
+from pyschemaelectrical.model.core import _DEFAULT_STYLE, Style, Symbol
 from pyschemaelectrical.model.primitives import (
     Circle,
     Element,
@@ -21,12 +21,22 @@ def _style_to_str(style: Style) -> str:
     """
     Evaluate style object to SVG style string.
 
+    The shared default Style is recognised by identity and served from a
+    precomputed string.
+
     Args:
         style (Style): The style object to convert.
 
     Returns:
         str: The CSS style string.
     """
+    if style is _DEFAULT_STYLE:
+        return _DEFAULT_STYLE_STR
+    return _format_style(style)
+
+
+def _format_style(style: Style) -> str:
+    """Build the CSS style string for *style* field by field."""
     items = []
     if style.stroke:
         items.append(f"stroke:{style.stroke}")
@@ -41,6 +51,9 @@ def _style_to_str(style: Style) -> str:
     return ";".join(items)
 
 
+_DEFAULT_STYLE_STR = _format_style(_DEFAULT_STYLE)
+
+
 def _render_element(elem: Element, parent: ET.Element):  # noqa: C901
     """
     Recursively render elements to the XML tree.
@@ -1,6 +1,7 @@
 import math
 import re
 import warnings
+from collections.abc import Iterable
 from dataclasses import replace
 from functools import singledispatch
 from typing import Any, TypeVar, cast
@@ -52,7 +53,7 @@ def translate(obj: T, dx: float, dy: float) -> T:
         )
 
     elif isinstance(obj, Polygon):
-        return cast(T, replace(obj, points=[translate(p, dx, dy) for p in obj.points]))
+        return cast(T, replace(obj, points=translate_points(obj.points, dx, dy)))
 
     elif isinstance(obj, Path):
         new_d = _translate_path_d(obj.d, dx, dy)
@@ -73,6 +74,24 @@ def translate(obj: T, dx: float, dy: float) -> T:
     return obj
 
 
+def translate_points(points: Iterable[Point], dx: float, dy: float) -> list[Point]:
+    """
+    Translate many points by the same (dx, dy) in one pass.
+
+    Bulk counterpart of ``translate`` for plain points: it skips the
+    per-object type dispatch and builds each Point directly.
+
+    Args:
+        points (Iterable[Point]): The points to translate.
+        dx (float): Shift in x.
+        dy (float): Shift in y.
+
+    Returns:
+        list[Point]: The translated points, in input order.
+    """
+    return [Point(p.x + dx, p.y + dy) for p in points]
+
+
 def rotate_point(p: Point, angle_deg: float, center: Point = _ORIGIN) -> Point:
     """
     Rotate a point around a center.
@@ -11,6 +11,9 @@ from dataclasses import replace
 
 from pyschemaelectrical.model.state import GenerationState
 
+# Bound once: natural_sort_key runs for every element of every sort it keys.
+_SPLIT_DIGITS = re.compile(r"(\d+)").split
+
 
 def natural_sort_key(tag: str) -> list[int | str]:
     """
@@ -30,7 +33,7 @@ def natural_sort_key(tag: str) -> list[int | str]:
         sorted(["K10", "K2", "K1"], key=natural_sort_key)
         # → ["K1", "K2", "K10"]
     """
-    return [int(p) if p.isdigit() else p for p in re.split(r"(\d+)", tag)]
+    return [int(p) if p.isdigit() else p for p in _SPLIT_DIGITS(tag)]
 
 
 def set_tag_counter(state: GenerationState, prefix: str, value: int) -> GenerationState:
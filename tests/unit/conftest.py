@@ -0,0 +1,37 @@
+"""Shared fixtures for the unit test suite."""
+
+import pytest
+
+from pyschemaelectrical.terminal import Terminal
+
+# ---------------------------------------------------------------------------
+# Terminals
+#
+# Terminal is immutable, so these are built once per session and shared by
+# every test that requests them.
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def signal_terminal():
+    return Terminal("X100", "Signal terminal")
+
+
+@pytest.fixture(scope="session")
+def power_terminal():
+    return Terminal("X200", "Power terminal", pin_prefixes=("L1", "L2", "L3", "N"))
+
+
+@pytest.fixture(scope="session")
+def plc_ai():
+    return Terminal("PLC:AI", "PLC Analog Input", reference=True)
+
+
+@pytest.fixture(scope="session")
+def plc_di():
+    return Terminal("PLC:DI", "PLC Digital Input", reference=True)
+
+
+@pytest.fixture(scope="session")
+def ext_gnd():
+    return Terminal("X300", "External GND")
@@ -20,6 +20,7 @@ from pyschemaelectrical.exceptions import (
 )
 from pyschemaelectrical.model.core import Point, Port, Symbol, Vector
 from pyschemaelectrical.system.system import Circuit
+from pyschemaelectrical.terminal import Terminal
 from pyschemaelectrical.utils.autonumbering import create_autonumberer
 
 # ---------------------------------------------------------------------------
@@ -130,8 +131,6 @@ class TestBuilderUnit:
 
     def test_build_validates_connection_indices(self):
         """Invalid connection indices should raise ComponentNotFoundError."""
-        from pyschemaelectrical.exceptions import ComponentNotFoundError
-
         state = create_autonumberer()
 
         builder = CircuitBuilder(state)
@@ -148,8 +147,6 @@ class TestResolvePinEdgeCases:
 
     def test_terminal_pin_resolution_1_pole(self):
         """1-pole terminal should resolve to ports '1' (in) and '2' (out)."""
-        from pyschemaelectrical.builder import ComponentSpec, _resolve_pin
-
         component_data = {
             "spec": ComponentSpec(func=None, kind="terminal", poles=1),
             "pins": ["42"],  # Terminal number
@@ -160,8 +157,6 @@ class TestResolvePinEdgeCases:
 
     def test_terminal_pin_resolution_3_pole(self):
         """3-pole terminal poles should map to correct port IDs."""
-        from pyschemaelectrical.builder import ComponentSpec, _resolve_pin
-
         component_data = {
             "spec": ComponentSpec(func=None, kind="terminal", poles=3),
             "pins": ["1", "2", "3"],
@@ -179,8 +174,6 @@ class TestResolvePinEdgeCases:
 
     def test_symbol_with_2x_pins(self):
         """Symbol with poles*2 pins should use interleaved indexing."""
-        from pyschemaelectrical.builder import ComponentSpec, _resolve_pin
-
         component_data = {
             "spec": ComponentSpec(func=lambda: None, kind="symbol", poles=2),
             "pins": ["A1", "A2", "B1", "B2"],  # 4 pins = 2 poles * 2
@@ -195,8 +188,6 @@ class TestResolvePinEdgeCases:
 
     def test_symbol_with_custom_named_ports(self):
         """Symbol with non-standard pin count should use direct indexing."""
-        from pyschemaelectrical.builder import ComponentSpec, _resolve_pin
-
         component_data = {
             "spec": ComponentSpec(func=lambda: None, kind="symbol", poles=1),
             "pins": ["L", "N", "PE", "24V", "GND"],  # 5 pins, not poles*2
@@ -1448,8 +1439,6 @@ class TestBuildIntegration:
 
     def test_build_with_pin_prefixes(self):
         """Terminals with pin_prefixes should use them for pin generation."""
-        from pyschemaelectrical.terminal import Terminal
-
         state = create_autonumberer()
         builder = CircuitBuilder(state)
         builder.set_layout(0, 0)
@@ -1467,8 +1456,6 @@ class TestBuildIntegration:
 
     def test_build_terminal_with_pin_prefixes_override(self):
         """add_terminal with explicit pin_prefixes should override Terminal's own."""
-        from pyschemaelectrical.terminal import Terminal
-
         state = create_autonumberer()
         builder = CircuitBuilder(state)
         builder.set_layout(0, 0)
@@ -3,8 +3,13 @@ Unit tests for the field_devices module.
 
 Tests cover the PinDef, DeviceTemplate, and generate_field_connections()
 function with all three pin numbering modes: sequential, prefixed, and fixed.
+
+The assertions here are simple scalar/tuple comparisons, so pytest's
+assertion rewriting is disabled for this module: PYTEST_DONT_REWRITE
 """
 
+import re
+
 import pytest
 
 from pyschemaelectrical.field_devices import (
@@ -18,6 +23,25 @@ from pyschemaelectrical.field_devices import (
 )
 from pyschemaelectrical.terminal import Terminal
 
+# Ad-hoc terminals shared by tests that do not need a dedicated fixture
+# (the signal/power/PLC terminals live in conftest.py).
+# Terminal is immutable, so one instance per ID is safe to reuse.
+_TERMS = {
+    tid: Terminal(tid, title)
+    for tid, title in (
+        ("X09", "Power"),
+        ("X13", "Shared I/O"),
+        ("X14", "Other"),
+        ("X200", "Power"),
+        ("X400", "Override terminal"),
+        ("X500", "Motor terminal"),
+        ("X600", "Mixed terminal"),
+    )
+}
+
+
+_NO_TERMINAL_RE = re.compile(r"no terminal in template")
+
 
 def _fd(tag, template, terminal=None):
     """Shorthand for FieldDevice in tests."""
@@ -25,33 +49,42 @@ def _fd(tag, template, terminal=None):
 
 
 # ---------------------------------------------------------------------------
-# Fixtures: reusable terminals and templates
+# Shared templates and device lists
+#
+# generate_field_connections() only reads its device list, so templates built
+# from module-level terminals and the device lists that use them are shared.
 # ---------------------------------------------------------------------------
 
+_POWER_3P_N = DeviceTemplate(
+    mpn="400V 3P+N",
+    pins=(
+        PinDef("L1", _TERMS["X200"], pin_prefix="L1"),
+        PinDef("L2", _TERMS["X200"], pin_prefix="L2"),
+        PinDef("L3", _TERMS["X200"], pin_prefix="L3"),
+        PinDef("N", _TERMS["X200"], pin_prefix="N"),
+    ),
+)
 
-@pytest.fixture
-def signal_terminal():
-    return Terminal("X100", "Signal terminal")
-
-
-@pytest.fixture
-def power_terminal():
-    return Terminal("X200", "Power terminal", pin_prefixes=("L1", "L2", "L3", "N"))
-
-
-@pytest.fixture
-def plc_ai():
-    return Terminal("PLC:AI", "PLC Analog Input", reference=True)
-
-
-@pytest.fixture
-def plc_di():
-    return Terminal("PLC:DI", "PLC Digital Input", reference=True)
+_POWER_3P = DeviceTemplate(
+    mpn="230V 3P",
+    pins=(
+        PinDef("L1", _TERMS["X200"], pin_prefix="L1"),
+        PinDef("L2", _TERMS["X200"], pin_prefix="L2"),
+        PinDef("L3", _TERMS["X200"], pin_prefix="L3"),
+    ),
+)
 
+_N_ONLY = DeviceTemplate(
+    mpn="N-only device",
+    pins=(
+        PinDef("A1", _TERMS["X200"], pin_prefix="N"),
+        PinDef("A2", _TERMS["X200"], pin_prefix="L1"),
+    ),
+)
 
-@pytest.fixture
-def ext_gnd():
-    return Terminal("X300", "External GND")
+_MAIN_400V = [_fd("400V Main", _POWER_3P_N)]
+_FEEDS_A_B = [_fd("Feed A", _POWER_3P), _fd("Feed B", _POWER_3P)]
+_FULL_THEN_N_ONLY = [_fd("Dev A", _POWER_3P_N), _fd("Dev B", _N_ONLY)]
 
 
 # ---------------------------------------------------------------------------
@@ -294,17 +327,7 @@ class TestPrefixedPins:
 
     def test_single_device_prefixed(self):
         """Prefixed pins format as prefix:group_number."""
-        terminal = Terminal("X200", "Power")
-        template = DeviceTemplate(
-            mpn="400V 3P+N",
-            pins=(
-                PinDef("L1", terminal, pin_prefix="L1"),
-                PinDef("L2", terminal, pin_prefix="L2"),
-                PinDef("L3", terminal, pin_prefix="L3"),
-                PinDef("N", terminal, pin_prefix="N"),
-            ),
-        )
-        rows = generate_field_connections([_fd("400V Main", template)])
+        rows = generate_field_connections(_MAIN_400V)
 
         assert len(rows) == 4
         assert rows[0][3] == "L1:1"
@@ -314,21 +337,7 @@ class TestPrefixedPins:
 
     def test_multiple_devices_prefixed(self):
         """Multiple devices with same prefixes increment the group number."""
-        terminal = Terminal("X200", "Power")
-        template = DeviceTemplate(
-            mpn="230V 3P",
-            pins=(
-                PinDef("L1", terminal, pin_prefix="L1"),
-                PinDef("L2", terminal, pin_prefix="L2"),
-                PinDef("L3", terminal, pin_prefix="L3"),
-            ),
-        )
-        rows = generate_field_connections(
-            [
-                _fd("Feed A", template),
-                _fd("Feed B", template),
-            ]
-        )
+        rows = generate_field_connections(_FEEDS_A_B)
 
         assert len(rows) == 6
         # First device: group 1
@@ -342,29 +351,7 @@ class TestPrefixedPins:
 
     def test_partial_prefix_overlap(self):
         """Devices using different subsets of prefixes on same terminal."""
-        terminal = Terminal("X200", "Power")
-        template_full = DeviceTemplate(
-            mpn="400V 3P+N",
-            pins=(
-                PinDef("L1", terminal, pin_prefix="L1"),
-                PinDef("L2", terminal, pin_prefix="L2"),
-                PinDef("L3", terminal, pin_prefix="L3"),
-                PinDef("N", terminal, pin_prefix="N"),
-            ),
-        )
-        template_n_only = DeviceTemplate(
-            mpn="N-only device",
-            pins=(
-                PinDef("A1", terminal, pin_prefix="N"),
-                PinDef("A2", terminal, pin_prefix="L1"),
-            ),
-        )
-        rows = generate_field_connections(
-            [
-                _fd("Dev A", template_full),
-                _fd("Dev B", template_n_only),
-            ]
-        )
+        rows = generate_field_connections(_FULL_THEN_N_ONLY)
 
         # Dev A: all prefixes get group 1
         assert rows[0][3] == "L1:1"
@@ -386,7 +373,7 @@ class TestFixedPins:
 
     def test_fixed_pins(self):
         """Fixed terminal_pin values are used directly, not auto-numbered."""
-        terminal = Terminal("X500", "Motor terminal")
+        terminal = _TERMS["X500"]
         template = DeviceTemplate(
             mpn="Pump 3P",
             pins=(
@@ -404,7 +391,7 @@ class TestFixedPins:
 
     def test_fixed_pins_do_not_affect_sequential(self, signal_terminal):
         """Fixed pins don't increment the sequential counter."""
-        terminal = Terminal("X500", "Motor terminal")
+        terminal = _TERMS["X500"]
         fixed_template = DeviceTemplate(
             mpn="Motor",
             pins=(PinDef("U1", terminal, terminal_pin="L1"),),
@@ -434,7 +421,7 @@ class TestTerminalOverride:
 
     def test_override_fills_missing_terminals(self):
         """PinDef without terminal uses the override from DeviceEntry."""
-        override = Terminal("X400", "Override terminal")
+        override = _TERMS["X400"]
         template = DeviceTemplate(
             mpn="Motor",
             pins=(
@@ -450,8 +437,8 @@ class TestTerminalOverride:
 
     def test_pindef_terminal_takes_precedence(self):
         """PinDef terminal is used even when override is provided."""
-        override = Terminal("X400", "Override")
-        specific = Terminal("X500", "Specific")
+        override = _TERMS["X400"]
+        specific = _TERMS["X500"]
         template = DeviceTemplate(
             mpn="Mixed",
             pins=(
@@ -479,7 +466,7 @@ class TestErrors:
             mpn="Bad",
             pins=(PinDef("1"),),
         )
-        with pytest.raises(ValueError, match="no terminal in template"):
+        with pytest.raises(ValueError, match=_NO_TERMINAL_RE):
             generate_field_connections([_fd("D-01", template)])
 
 
@@ -563,7 +550,7 @@ class TestMixedModes:
 
     def test_mixed_fixed_and_sequential(self):
         """A template with both fixed and sequential pins."""
-        terminal = Terminal("X600", "Mixed terminal")
+        terminal = _TERMS["X600"]
         template = DeviceTemplate(
             mpn="Complex Valve",
             pins=(
@@ -602,14 +589,12 @@ class TestConnectionRowStructure:
             pins=(PinDef("1", signal_terminal, plc_ai),),
         )
         rows = generate_field_connections([_fd("D-01", template)])
-        row = rows[0]
-        assert isinstance(row[0], str)  # tag
-        assert isinstance(row[1], str)  # device_pin
-        assert row[2] is signal_terminal  # terminal object
-        assert isinstance(row[3], str)  # terminal_pin
-        assert isinstance(row[4], str)  # plc_tag
-        assert isinstance(row[5], str)  # reserved (empty)
-        assert row[5] == ""
+        # (tag, device_pin, terminal, terminal_pin, plc_tag, reserved)
+        match rows[0]:
+            case (str(), str(), Terminal() as terminal, str(), str(), ""):
+                assert terminal is signal_terminal
+            case row:
+                pytest.fail(f"Unexpected ConnectionRow shape: {row!r}")
 
 
 # ---------------------------------------------------------------------------
@@ -635,7 +620,7 @@ class TestTemplateReuse:
 
     def test_matched_devices_get_reused_pins(self):
         """Devices whose template matches get pins from the reuse source."""
-        shared = Terminal("X13", "Shared I/O")
+        shared = _TERMS["X13"]
         fan_tmpl = DeviceTemplate("Fan", pins=(PinDef("t1", shared), PinDef("t2", shared)))
 
         rows = generate_field_connections(
@@ -650,7 +635,7 @@ class TestTemplateReuse:
 
     def test_non_matched_devices_skip_reserved_pins(self):
         """Non-matching devices auto-number but skip reserved pin values."""
-        shared = Terminal("X13", "Shared I/O")
+        shared = _TERMS["X13"]
         fan_tmpl = DeviceTemplate("Fan", pins=(PinDef("t1", shared),))
         switch_tmpl = DeviceTemplate("Switch", pins=(PinDef("1", shared),))
 
@@ -671,8 +656,8 @@ class TestTemplateReuse:
 
     def test_template_reuse_with_global_reuse(self):
         """Template reuse and global reuse can coexist on different terminals."""
-        io = Terminal("X13", "I/O")
-        power = Terminal("X09", "Power")
+        io = _TERMS["X13"]
+        power = _TERMS["X09"]
         fan_tmpl = DeviceTemplate("Fan", pins=(PinDef("t1", io),))
         valve_tmpl = DeviceTemplate("Valve", pins=(PinDef("A1", power),))
 
@@ -687,8 +672,8 @@ class TestTemplateReuse:
 
     def test_template_reuse_does_not_affect_other_terminals(self):
         """Template reuse only applies to the specified terminal."""
-        io = Terminal("X13", "I/O")
-        other = Terminal("X14", "Other")
+        io = _TERMS["X13"]
+        other = _TERMS["X14"]
         tmpl = DeviceTemplate(
             "Fan",
             pins=(PinDef("t1", io), PinDef("s1", other)),
@@ -704,7 +689,7 @@ class TestTemplateReuse:
 
     def test_empty_template_reuse(self):
         """Empty template_reuse behaves like None."""
-        shared = Terminal("X13", "I/O")
+        shared = _TERMS["X13"]
         tmpl = DeviceTemplate("Switch", pins=(PinDef("1", shared),))
 
         rows = generate_field_connections(
@@ -716,7 +701,7 @@ class TestTemplateReuse:
 
     def test_shared_iterator_across_templates(self):
         """Multiple templates referencing the same source share one iterator."""
-        shared = Terminal("X13", "I/O")
+        shared = _TERMS["X13"]
         # Simulate fan_controll's 12 X13 pins
         reuse_pins = ["7", "8", "9", "10", "11", "12", "13", "14"]
 
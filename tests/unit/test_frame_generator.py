@@ -1,5 +1,8 @@
 """Tests for the A3 frame generator."""
 
+import pytest
+
+from pyschemaelectrical.model.primitives import Line, Text
 from pyschemaelectrical.rendering.typst.frame_generator import (
     A3_HEIGHT,
     A3_WIDTH,
@@ -13,6 +16,23 @@ from pyschemaelectrical.rendering.typst.frame_generator import (
 )
 
 
+@pytest.fixture(scope="module")
+def default_frame():
+    """Default frame with its Text and Line elements split in a single pass.
+
+    Returns ``(circuit, texts, lines)``. Shared read-only across the module.
+    """
+    circuit = generate_frame()
+    texts: list[Text] = []
+    lines: list[Line] = []
+    for e in circuit.elements:
+        if isinstance(e, Text):
+            texts.append(e)
+        elif isinstance(e, Line):
+            lines.append(e)
+    return circuit, texts, lines
+
+
 def test_a3_dimensions():
     """A3 dimensions should be 420x297mm."""
     assert A3_WIDTH == 420
@@ -33,19 +53,16 @@ def test_inner_frame_positions():
     assert INNER_FRAME_Y2 == 287
 
 
-def test_generate_frame_returns_circuit():
+def test_generate_frame_returns_circuit(default_frame):
     """generate_frame should return a Circuit with elements."""
-    circuit = generate_frame()
+    circuit, _, _ = default_frame
     assert circuit is not None
     assert len(circuit.elements) > 0
 
 
-def test_generate_frame_has_grid_labels():
+def test_generate_frame_has_grid_labels(default_frame):
     """Frame should contain column (1-8) and row (A-F) labels."""
-    from pyschemaelectrical.model.primitives import Text
-
-    circuit = generate_frame()
-    texts = [e for e in circuit.elements if isinstance(e, Text)]
+    _, texts, _ = default_frame
 
     # Should have labels for 8 columns * 2 sides + 6 rows * 2 sides = 28 labels
     labels = [t.content for t in texts]
@@ -57,19 +74,14 @@ def test_generate_frame_has_grid_labels():
 
 def test_generate_frame_custom_font():
     """generate_frame should accept a custom font_family parameter."""
-    from pyschemaelectrical.model.primitives import Text
-
     circuit = generate_frame(font_family="Arial")
     texts = [e for e in circuit.elements if isinstance(e, Text)]
     # At least one text should have the custom font
     assert any(t.style.font_family == "Arial" for t in texts)
 
 
-def test_generate_frame_has_lines():
+def test_generate_frame_has_lines(default_frame):
     """Frame should contain border lines."""
-    from pyschemaelectrical.model.primitives import Line
-
-    circuit = generate_frame()
-    lines = [e for e in circuit.elements if isinstance(e, Line)]
+    _, _, lines = default_frame
     # Two rectangles (outer + inner) = 8 lines, plus grid dividers
     assert len(lines) >= 8
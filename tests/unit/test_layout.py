@@ -1,6 +1,12 @@
+from collections import OrderedDict
+
+import pytest
+
 from pyschemaelectrical.layout.layout import (
+    _EMPTY_SPEC,
     _find_matching_ports,
     _get_wire_label_spec,
+    _match_xs,
     auto_connect,
     auto_connect_labeled,
     create_horizontal_layout,
@@ -45,25 +51,43 @@ def _sym_with_down_up(
     return _make_symbol(ports, label=label)
 
 
+# ---------------------------------------------------------------------------
+# Shared symbols
+#
+# Symbols are frozen and only read by the tests below, so the most common
+# unlabelled shapes are built once per module.
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def sym_down_10() -> Symbol:
+    """Single downward port at (10, 20)."""
+    return _sym_with_down_up(down_x=[10], up_x=[])
+
+
+@pytest.fixture(scope="module")
+def sym_up_10() -> Symbol:
+    """Single upward port at (10, 40)."""
+    return _sym_with_down_up(down_x=[], up_x=[10], y_up=40)
+
+
+@pytest.fixture(scope="module")
+def sym_down_10_20_30() -> Symbol:
+    """Downward ports at x = 10, 20 and 30 (y = 20)."""
+    return _sym_with_down_up(down_x=[10, 20, 30], up_x=[])
+
+
 def mock_circuit_generator(state, x, y):
-    # Mock generator that increments a counter in state and returns a dummy element
+    # Mock generator that increments a counter in state and returns a dummy element.
+    # The mock only tracks "count", so it returns a fresh state dict rather
+    # than copying the incoming one.
     count = state.get("count", 0)
-    new_state = state.copy()
-    new_state["count"] = count + 1
-
-    # Return a dummy element with the given position.
-    # Element is abstract, but we can't instantiate it
-    # directly if it's strictly abstract (dataclass isn't
-    # abc usually).
-    # But Point is NOT an Element.
-    # Let's return a list containing a Point? No, return
-    # type says List[Element].
-    # But for the test, as long as it returns *something*
-    # compatible with list extension.
-    element = Point(x, y)
-    return new_state, [element]
 
+    # Point is not an Element, but any object works for list extension here.
+    return {"count": count + 1}, [Point(x, y)]
 
+
+@pytest.mark.fast
 class TestLayoutUnit:
     def test_layout_horizontal(self):
         state = {"count": 0}
@@ -199,10 +223,10 @@ class TestGetConnectionPorts:
 class TestAutoConnect:
     """Tests for auto_connect(sym_above, sym_below)."""
 
-    def test_single_aligned_pair(self):
+    def test_single_aligned_pair(self, sym_down_10, sym_up_10):
         """A single down port aligned with a single up port creates one Line."""
-        sym_top = _sym_with_down_up(down_x=[10], up_x=[], y_down=20)
-        sym_bot = _sym_with_down_up(down_x=[], up_x=[10], y_up=40)
+        sym_top = sym_down_10
+        sym_bot = sym_up_10
 
         lines = auto_connect(sym_top, sym_bot)
         assert len(lines) == 1
@@ -210,9 +234,9 @@ class TestAutoConnect:
         assert lines[0].start == Point(10, 20)
         assert lines[0].end == Point(10, 40)
 
-    def test_multiple_aligned_pairs(self):
+    def test_multiple_aligned_pairs(self, sym_down_10_20_30):
         """Three aligned columns should produce three lines."""
-        sym_top = _sym_with_down_up(down_x=[10, 20, 30], up_x=[])
+        sym_top = sym_down_10_20_30
         sym_bot = _sym_with_down_up(down_x=[], up_x=[10, 20, 30], y_up=50)
 
         lines = auto_connect(sym_top, sym_bot)
@@ -220,17 +244,17 @@ class TestAutoConnect:
         x_values = sorted([line.start.x for line in lines])
         assert x_values == [10, 20, 30]
 
-    def test_no_alignment_no_lines(self):
+    def test_no_alignment_no_lines(self, sym_down_10):
         """If ports don't align in X, no lines are created."""
-        sym_top = _sym_with_down_up(down_x=[10], up_x=[])
+        sym_top = sym_down_10
         sym_bot = _sym_with_down_up(down_x=[], up_x=[50], y_up=40)
 
         lines = auto_connect(sym_top, sym_bot)
         assert lines == []
 
-    def test_partial_alignment(self):
+    def test_partial_alignment(self, sym_down_10_20_30):
         """Only the aligned subset should produce lines."""
-        sym_top = _sym_with_down_up(down_x=[10, 20, 30], up_x=[])
+        sym_top = sym_down_10_20_30
         sym_bot = _sym_with_down_up(down_x=[], up_x=[10, 30], y_up=40)
 
         lines = auto_connect(sym_top, sym_bot)
@@ -238,23 +262,62 @@ class TestAutoConnect:
         x_values = sorted([line.start.x for line in lines])
         assert x_values == [10, 30]
 
-    def test_tolerance_boundary_just_inside(self):
+    def test_tolerance_boundary_just_inside(self, sym_down_10):
         """Ports whose X differs by less than the tolerance should connect."""
         # DEFAULT_WIRE_ALIGNMENT_TOLERANCE = 0.1
-        sym_top = _sym_with_down_up(down_x=[10.0], up_x=[])
+        sym_top = sym_down_10
         sym_bot = _sym_with_down_up(down_x=[], up_x=[10.05], y_up=40)
 
         lines = auto_connect(sym_top, sym_bot)
         assert len(lines) == 1
 
-    def test_tolerance_boundary_just_outside(self):
+    def test_tolerance_boundary_just_outside(self, sym_down_10):
         """Ports whose X differs by >= tolerance should NOT connect."""
-        sym_top = _sym_with_down_up(down_x=[10.0], up_x=[])
+        sym_top = sym_down_10
         sym_bot = _sym_with_down_up(down_x=[], up_x=[10.2], y_up=40)
 
         lines = auto_connect(sym_top, sym_bot)
         assert len(lines) == 0
 
+    def test_bucket_edges_within_tolerance_connect(self):
+        """Ports straddling a bucket boundary still connect when within tolerance."""
+        sym_top = _sym_with_down_up(down_x=[0.19, -0.04], up_x=[])
+        sym_bot = _sym_with_down_up(down_x=[], up_x=[0.21, 0.05], y_up=40)
+
+        lines = auto_connect(sym_top, sym_bot)
+        assert [(line.start.x, line.end.x) for line in lines] == [
+            (0.19, 0.21),
+            (-0.04, 0.05),
+        ]
+
+    def test_all_matches_emitted_in_up_port_order(self, sym_down_10):
+        """A down port aligned with several up ports connects to each in order."""
+        sym_top = sym_down_10
+        sym_bot = _make_symbol(
+            {
+                "a": _port("a", 10.05, 40, 0, -1),
+                "b": _port("b", 9.95, 50, 0, -1),
+            }
+        )
+
+        lines = auto_connect(sym_top, sym_bot)
+        assert [line.end for line in lines] == [Point(10.05, 40), Point(9.95, 50)]
+
+    def test_disjoint_x_spans_no_lines(self, sym_down_10_20_30):
+        """Port spans that do not come within tolerance produce no lines."""
+        left = _sym_with_down_up(down_x=[], up_x=[-5, 9.8], y_up=40)
+        right = _sym_with_down_up(down_x=[], up_x=[30.2, 70], y_up=40)
+
+        assert auto_connect(sym_down_10_20_30, left) == []
+        assert auto_connect(sym_down_10_20_30, right) == []
+
+    def test_span_edges_within_tolerance_connect(self, sym_down_10_20_30):
+        """Only the outermost ports overlapping within tolerance still connect."""
+        sym_bot = _sym_with_down_up(down_x=[], up_x=[-5, 9.95, 30.05, 70], y_up=40)
+
+        lines = auto_connect(sym_down_10_20_30, sym_bot)
+        assert [line.end.x for line in lines] == [9.95, 30.05]
+
     def test_empty_symbols(self):
         """Two empty symbols produce no lines."""
         sym_top = _make_symbol({})
@@ -277,10 +340,10 @@ class TestAutoConnect:
         lines = auto_connect(sym_top, sym_bot)
         assert lines == []
 
-    def test_returned_lines_have_style(self):
+    def test_returned_lines_have_style(self, sym_down_10, sym_up_10):
         """Lines produced by auto_connect should have standard_style applied."""
-        sym_top = _sym_with_down_up(down_x=[10], up_x=[])
-        sym_bot = _sym_with_down_up(down_x=[], up_x=[10], y_up=40)
+        sym_top = sym_down_10
+        sym_bot = sym_up_10
 
         lines = auto_connect(sym_top, sym_bot)
         assert len(lines) == 1
@@ -288,6 +351,13 @@ class TestAutoConnect:
         assert lines[0].style is not None
         assert lines[0].style.stroke == "black"
 
+    def test_lines_share_one_style_instance(self, sym_down_10_20_30):
+        """All connection lines reference the same cached standard style."""
+        sym_bot = _sym_with_down_up(down_x=[], up_x=[10, 20, 30], y_up=40)
+
+        lines = auto_connect(sym_down_10_20_30, sym_bot)
+        assert len({id(line.style) for line in lines}) == 1
+
 
 # ===================================================================
 # _find_matching_ports
@@ -364,6 +434,60 @@ class TestFindMatchingPorts:
         # The first up port in the list should be matched
         assert pairs[0][1].id == "u1"
 
+    def test_first_match_wins_regardless_of_x_order(self):
+        """List order, not X order, decides between candidates within tolerance."""
+        down = [_port("d1", 10, 20, 0, 1)]
+        up = [_port("u1", 10.05, 40, 0, -1), _port("u2", 10.0, 50, 0, -1)]
+
+        pairs = _find_matching_ports(down, up)
+        assert len(pairs) == 1
+        assert pairs[0][1].id == "u1"
+
+    def test_many_ports_match_by_column(self):
+        """Wide rows pair every down port with the up port in its column."""
+        xs = [i * 5.0 for i in range(50)]
+        down = [_port(f"d{i}", x, 20, 0, 1) for i, x in enumerate(reversed(xs))]
+        up = [_port(f"u{i}", x, 40, 0, -1) for i, x in enumerate(xs)]
+
+        pairs = _find_matching_ports(down, up)
+        assert len(pairs) == 50
+        assert all(dp.position.x == up.position.x for dp, up in pairs)
+        assert [dp.position.x for dp, _ in pairs] == xs
+
+
+# ===================================================================
+# _match_xs
+# ===================================================================
+
+
+class TestMatchXs:
+    """Tests for the float-only matching kernel _match_xs(down_xs, up_xs, tol)."""
+
+    def test_returns_index_pairs_in_down_x_order(self):
+        assert _match_xs([30.0, 10.0, 20.0], [10.0, 20.0, 30.0], 0.1) == [
+            (1, 0),
+            (2, 1),
+            (0, 2),
+        ]
+
+    def test_lowest_up_index_wins(self):
+        assert _match_xs([10.0], [10.05, 9.98, 10.0], 0.1) == [(0, 0)]
+
+    def test_equal_x_tie_keeps_original_order(self):
+        assert _match_xs([20.0], [20.0, 10.0, 20.0], 0.1) == [(0, 0)]
+
+    def test_up_index_shared_by_close_down_xs(self):
+        assert _match_xs([10.0, 10.04, 50.0], [10.02, 50.0], 0.1) == [
+            (0, 0),
+            (1, 0),
+            (2, 1),
+        ]
+
+    def test_unmatched_and_empty(self):
+        assert _match_xs([10.0], [10.2], 0.1) == []
+        assert _match_xs([], [10.0], 0.1) == []
+        assert _match_xs([10.0], [], 0.1) == []
+
 
 # ===================================================================
 # _get_wire_label_spec
@@ -426,6 +550,18 @@ class TestGetWireLabelSpec:
         specs = ["not_a_tuple"]
         assert _get_wire_label_spec(dp, 0, specs) == ("", "")  # type: ignore[invalid-argument-type]
 
+    def test_no_label_paths_share_one_tuple(self):
+        """Every "no label" path returns the shared _EMPTY_SPEC instance."""
+        dp = _port("d1", 10, 20, 0, 1)
+        for specs in (None, {}, [], {"X": ("RD", "1mm²")}, [("RD", "1mm²")], 5):
+            assert _get_wire_label_spec(dp, 3, specs) is _EMPTY_SPEC  # type: ignore[invalid-argument-type]
+
+    def test_dict_subclass_dispatches_as_dict(self):
+        """Dict subclasses (e.g. OrderedDict) use the port-ID lookup."""
+        dp = _port("L1", 10, 20, 0, 1)
+        specs = OrderedDict(L1=("RD", "2.5mm²"))
+        assert _get_wire_label_spec(dp, 0, specs) == ("RD", "2.5mm²")
+
 
 # ===================================================================
 # auto_connect_labeled
@@ -435,10 +571,10 @@ class TestGetWireLabelSpec:
 class TestAutoConnectLabeled:
     """Tests for auto_connect_labeled(sym_above, sym_below, labels)."""
 
-    def test_basic_labeled_connection(self):
+    def test_basic_labeled_connection(self, sym_down_10, sym_up_10):
         """Connect two symbols with wire label specs and verify elements are generated."""
-        sym_top = _sym_with_down_up(down_x=[10], up_x=[])
-        sym_bot = _sym_with_down_up(down_x=[], up_x=[10], y_up=40)
+        sym_top = sym_down_10
+        sym_bot = sym_up_10
 
         specs = [("RD", "2.5mm²")]
         elements = auto_connect_labeled(sym_top, sym_bot, wire_specs=specs)
@@ -451,10 +587,10 @@ class TestAutoConnectLabeled:
         assert len(texts) == 1
         assert "RD" in texts[0].content
 
-    def test_no_specs_still_creates_lines(self):
+    def test_no_specs_still_creates_lines(self, sym_down_10, sym_up_10):
         """With None specs, lines should still be created but without labels."""
-        sym_top = _sym_with_down_up(down_x=[10], up_x=[])
-        sym_bot = _sym_with_down_up(down_x=[], up_x=[10], y_up=40)
+        sym_top = sym_down_10
+        sym_bot = sym_up_10
 
         elements = auto_connect_labeled(sym_top, sym_bot, wire_specs=None)
 
@@ -463,10 +599,10 @@ class TestAutoConnectLabeled:
         assert len(lines) == 1
         assert len(texts) == 0
 
-    def test_empty_specs_creates_lines_without_labels(self):
+    def test_empty_specs_creates_lines_without_labels(self, sym_down_10, sym_up_10):
         """With empty dict specs, lines are created without labels."""
-        sym_top = _sym_with_down_up(down_x=[10], up_x=[])
-        sym_bot = _sym_with_down_up(down_x=[], up_x=[10], y_up=40)
+        sym_top = sym_down_10
+        sym_bot = sym_up_10
 
         elements = auto_connect_labeled(sym_top, sym_bot, wire_specs={})
 
@@ -475,9 +611,9 @@ class TestAutoConnectLabeled:
         assert len(lines) == 1
         assert len(texts) == 0
 
-    def test_multiple_connections_with_list_specs(self):
+    def test_multiple_connections_with_list_specs(self, sym_down_10_20_30):
         """Three aligned ports with list specs produce 3 lines and 3 labels."""
-        sym_top = _sym_with_down_up(down_x=[10, 20, 30], up_x=[])
+        sym_top = sym_down_10_20_30
         sym_bot = _sym_with_down_up(down_x=[], up_x=[10, 20, 30], y_up=40)
 
         specs = [("RD", "2.5mm²"), ("BK", "2.5mm²"), ("BU", "2.5mm²")]
@@ -511,9 +647,9 @@ class TestAutoConnectLabeled:
         assert len(lines) == 2
         assert len(texts) == 2
 
-    def test_no_aligned_ports_produces_nothing(self):
+    def test_no_aligned_ports_produces_nothing(self, sym_down_10):
         """If no ports align, no elements should be produced."""
-        sym_top = _sym_with_down_up(down_x=[10], up_x=[])
+        sym_top = sym_down_10
         sym_bot = _sym_with_down_up(down_x=[], up_x=[99], y_up=40)
 
         elements = auto_connect_labeled(sym_top, sym_bot, wire_specs=[("RD", "2.5mm²")])
@@ -654,6 +790,20 @@ class TestLayoutVerticalChain:
         # sym2 (y=60) -> sym3 (y=120): down port at (50,65) to up port at (50,115) -> 1 line
         assert len(lines) == 2
 
+    def test_symbols_precede_connection_lines(self):
+        """All placed symbols are listed before the connection lines, top to bottom."""
+        sym1 = _sym_with_down_up(down_x=[0], up_x=[], y_down=5, label="S1")
+        sym2 = _sym_with_down_up(down_x=[0], up_x=[0], y_down=5, y_up=-5, label="S2")
+        sym3 = _sym_with_down_up(down_x=[], up_x=[0], y_up=-5, label="S3")
+
+        elements = layout_vertical_chain(
+            [sym1, sym2, sym3], start=Point(50, 0), spacing=60
+        )
+
+        assert [getattr(e, "label", None) for e in elements[:3]] == ["S1", "S2", "S3"]
+        assert all(isinstance(e, Line) for e in elements[3:])
+        assert [e.start.y for e in elements[3:]] == [5, 65]
+
     def test_horizontal_position_preserved(self):
         """start.x should be applied to all symbols."""
         sym = _make_symbol(
@@ -712,6 +862,39 @@ class TestLayoutHorizontalAdditional:
             assert isinstance(p, Point)
             assert p.y == 42
 
+    def test_x_positions_are_start_plus_index_times_spacing(self):
+        """Each copy is placed at exactly start_x + i * spacing."""
+
+        def gen(s, x, y):
+            return s, [Point(x, y)]
+
+        _, elements = layout_horizontal(
+            start_state={},
+            start_x=1.5,
+            start_y=0,
+            spacing=0.1,
+            count=7,
+            generate_func=gen,
+        )
+        assert [p.x for p in elements] == [1.5 + i * 0.1 for i in range(7)]
+
+    def test_int_and_float_spacing_keep_their_types(self):
+        """Cached layouts must not mix int and float X positions."""
+
+        def gen(s, x, y):
+            return s, [Point(x, y)]
+
+        for spacing in (10, 10.0, 10):
+            _, elements = layout_horizontal(
+                start_state={},
+                start_x=0,
+                start_y=0,
+                spacing=spacing,
+                count=3,
+                generate_func=gen,
+            )
+            assert [type(p.x) for p in elements[1:]] == [type(spacing)] * 2
+
     def test_state_threading(self):
         """State should be threaded through sequential calls."""
 
@@ -840,6 +1023,32 @@ class TestCreateHorizontalLayout:
         # Original should be untouched
         assert "F" not in defaults
 
+    @pytest.mark.parametrize(
+        ("defaults", "overrides"),
+        [({"Q": "default_q"}, None), ({}, {"F": "override_f"})],
+        ids=["defaults_only", "overrides_only"],
+    )
+    def test_generator_writes_do_not_reach_caller(self, defaults, overrides):
+        """A generator mutating its mapping must not change the caller's dicts."""
+        before = (dict(defaults), dict(overrides or {}))
+
+        def gen(state, x, y, tag_gens, tm, idx):
+            tag_gens["K"] = "written_by_generator"
+            return state, []
+
+        create_horizontal_layout(
+            state={},
+            start_x=0,
+            start_y=0,
+            count=2,
+            spacing=20,
+            generator_func_single=gen,
+            default_tag_generators=defaults,
+            tag_generators=overrides,
+        )
+
+        assert (defaults, overrides or {}) == before
+
     def test_terminal_maps_default_to_empty(self):
         """When terminal_maps is None, generator should receive empty dict."""
         received_tm = []
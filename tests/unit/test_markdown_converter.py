@@ -1,19 +1,13 @@
 """Tests for the Markdown to Typst converter."""
 
 import os
-import tempfile
 
-from pyschemaelectrical.rendering.typst.markdown_converter import (
-    markdown_to_typst,
-)
+import pytest
 
+from pyschemaelectrical.rendering.typst import markdown_converter
+from pyschemaelectrical.rendering.typst.markdown_converter import markdown_to_typst
 
-def _write_md(tmpdir, content):
-    """Helper to write a temporary MD file."""
-    path = os.path.join(tmpdir, "test.md")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    return path
+pytestmark = pytest.mark.io
 
 
 def test_missing_file_returns_empty():
@@ -22,64 +16,96 @@ def test_missing_file_returns_empty():
     assert result == ""
 
 
-def test_heading_conversion():
+def test_missing_file_skips_conversion(monkeypatch, capsys):
+    """A missing file is rejected by the failed open, before any parse."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("converter called for a missing file")
+
+    monkeypatch.setattr(markdown_converter, "_convert_lines", fail)
+    assert markdown_to_typst("/nonexistent/other.md") == ""
+    assert "not found" in capsys.readouterr().out
+
+
+def test_heading_conversion(tmp_path):
     """Markdown headings should convert to Typst headings."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = _write_md(tmpdir, "# Title\n\n## Subtitle\n\n### Section\n")
-        result = markdown_to_typst(path)
-        assert "= Title" in result
-        assert "== Subtitle" in result
-        assert "=== Section" in result
+    path = tmp_path / "test.md"
+    path.write_text("# Title\n\n## Subtitle\n\n### Section\n", encoding="utf-8")
+    result = markdown_to_typst(str(path))
+    assert "= Title" in result
+    assert "== Subtitle" in result
+    assert "=== Section" in result
 
 
-def test_paragraph_conversion():
+def test_paragraph_conversion(tmp_path):
     """Plain text should convert to Typst paragraphs."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = _write_md(tmpdir, "Hello world\n")
-        result = markdown_to_typst(path)
-        assert "Hello world" in result
-        assert "#parbreak()" in result
+    path = tmp_path / "test.md"
+    path.write_text("Hello world\n", encoding="utf-8")
+    result = markdown_to_typst(str(path))
+    assert "Hello world" in result
+    assert "#parbreak()" in result
 
 
-def test_table_conversion():
+def test_table_conversion(tmp_path):
     """Markdown tables should convert to Typst tables."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        md = "| A | B |\n|---|---|\n| 1 | 2 |\n"
-        path = _write_md(tmpdir, md)
-        result = markdown_to_typst(path)
-        assert "#table(" in result
-        assert "[A]," in result
-        assert "[1]," in result
+    path = tmp_path / "test.md"
+    path.write_text("| A | B |\n|---|---|\n| 1 | 2 |\n", encoding="utf-8")
+    result = markdown_to_typst(str(path))
+    assert "#table(" in result
+    assert "[A]," in result
+    assert "[1]," in result
 
 
-def test_pagebreak_appended():
+def test_pagebreak_appended(tmp_path):
     """Output should end with a pagebreak."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = _write_md(tmpdir, "Hello\n")
-        result = markdown_to_typst(path)
-        assert "#pagebreak()" in result
+    path = tmp_path / "test.md"
+    path.write_text("Hello\n", encoding="utf-8")
+    result = markdown_to_typst(str(path))
+    assert "#pagebreak()" in result
 
 
-def test_notice_block():
+def test_notice_block(tmp_path):
     """Notice parameter should add a notice block."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = _write_md(tmpdir, "Hello\n")
-        result = markdown_to_typst(path, notice="CONFIDENTIAL")
-        assert "CONFIDENTIAL" in result
-        assert "luma(240)" in result  # notice block styling
+    path = tmp_path / "test.md"
+    path.write_text("Hello\n", encoding="utf-8")
+    result = markdown_to_typst(str(path), notice="CONFIDENTIAL")
+    assert "CONFIDENTIAL" in result
+    assert "luma(240)" in result  # notice block styling
 
 
-def test_no_notice_by_default():
+def test_no_notice_by_default(tmp_path):
     """No notice should be added when not specified."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = _write_md(tmpdir, "Hello\n")
-        result = markdown_to_typst(path)
-        assert "luma(240)" not in result
+    path = tmp_path / "test.md"
+    path.write_text("Hello\n", encoding="utf-8")
+    result = markdown_to_typst(str(path))
+    assert "luma(240)" not in result
 
 
-def test_custom_width():
+def test_custom_width(tmp_path):
     """Custom width parameter should be used."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = _write_md(tmpdir, "Hello\n")
-        result = markdown_to_typst(path, width="80%")
-        assert "80%" in result
+    path = tmp_path / "test.md"
+    path.write_text("Hello\n", encoding="utf-8")
+    result = markdown_to_typst(str(path), width="80%")
+    assert "80%" in result
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    """Rendering again after an edit should show the new contents."""
+    path = tmp_path / "test.md"
+    path.write_text("# Before\n", encoding="utf-8")
+    assert "= Before" in markdown_to_typst(str(path))
+    path.write_text("# After edit\n", encoding="utf-8")
+    result = markdown_to_typst(str(path))
+    assert "= After edit" in result
+    assert "= Before" not in result
+
+
+def test_same_size_edit_with_same_mtime_is_reread(tmp_path):
+    """A same-size rewrite that keeps the old mtime should still show."""
+    path = tmp_path / "test.md"
+    path.write_text("# Before\n", encoding="utf-8")
+    st = os.stat(path)
+    assert "= Before" in markdown_to_typst(str(path))
+    path.write_text("# Latest\n", encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert "= Latest" in markdown_to_typst(str(path))
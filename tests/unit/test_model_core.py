@@ -5,6 +5,7 @@ import pytest
 from pyschemaelectrical.model.core import Point, Port, Style, Symbol, Vector
 
 
+@pytest.mark.fast
 class TestModelCore:
     def test_vector_creation_and_ops(self):
         v1 = Vector(1.0, 2.0)
@@ -51,6 +52,19 @@ class TestModelCore:
         with pytest.raises(FrozenInstanceError):
             p.x = 1  # type: ignore[invalid-assignment]
 
+    def test_point_is_slotted(self):
+        p = Point(1, 2)
+        assert not hasattr(p, "__dict__")
+        assert p == Point(1, 2)
+        assert hash(p) == hash(Point(1, 2))
+
+    def test_value_types_are_slotted_and_frozen(self):
+        port = Port("1", Point(0, 0), Vector(0, 1))
+        for obj in (Vector(1, 0), Style(), port):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            port.id = "2"  # type: ignore[invalid-assignment]
+
     def test_style_defaults(self):
         s = Style()
         assert s.stroke == "black"
@@ -67,41 +81,34 @@ class TestModelCore:
         sym = Symbol(elements=[], ports={}, label="K1")
         assert sym.label == "K1"
 
-
-class TestStandardPins:
-    """Tests for flat pin constant definitions."""
-
-    def test_coil_pins(self):
-        from pyschemaelectrical.model.constants import COIL_PINS
-
-        assert COIL_PINS == ("A1", "A2")
-
-    def test_no_contact_pins(self):
-        from pyschemaelectrical.model.constants import NO_CONTACT_PINS
-
-        assert NO_CONTACT_PINS == ("13", "14")
-
-    def test_nc_contact_pins(self):
-        from pyschemaelectrical.model.constants import NC_CONTACT_PINS
-
-        assert NC_CONTACT_PINS == ("11", "12")
-
-    def test_cb_3p_pins(self):
-        from pyschemaelectrical.model.constants import CB_3P_PINS
-
-        assert CB_3P_PINS == ("1", "2", "3", "4", "5", "6")
-
-    def test_cb_2p_pins(self):
-        from pyschemaelectrical.model.constants import CB_2P_PINS
-
-        assert CB_2P_PINS == ("1", "2", "3", "4")
-
-    def test_contactor_3p_pins(self):
-        from pyschemaelectrical.model.constants import CONTACTOR_3P_PINS
-
-        assert CONTACTOR_3P_PINS == ("L1", "T1", "L2", "T2", "L3", "T3")
-
-    def test_thermal_overload_pins(self):
-        from pyschemaelectrical.model.constants import THERMAL_OVERLOAD_PINS
-
-        assert THERMAL_OVERLOAD_PINS == ("", "T1", "", "T2", "", "T3")
+    def test_symbol_vertical_port_views(self):
+        sym = Symbol(
+            elements=[],
+            ports={
+                "1": Port("1", Point(10, 0), Vector(0, -1)),
+                "2": Port("2", Point(10, 20), Vector(0, 1)),
+                "3": Port("3", Point(5, 10), Vector(1, 0)),
+                "4": Port("4", Point(20, 20), Vector(0, 1)),
+            },
+        )
+        assert [p.id for p in sym.down_ports] == ["2", "4"]
+        assert [p.id for p in sym.up_ports] == ["1"]
+        assert list(sym.down_xs) == [10.0, 20.0]
+        assert list(sym.up_xs) == [10.0]
+        # Cached on first access
+        assert sym.down_xs is sym.down_xs
+
+    def test_symbol_ports_facing_buckets_and_fallback(self):
+        diagonal = Vector(0.5, 0.5)
+        sym = Symbol(
+            elements=[],
+            ports={
+                "r": Port("r", Point(10, 0), Vector(1, 0)),
+                "l": Port("l", Point(0, 0), Vector(-1, 0)),
+                "r_alias": Port("r_alias", Point(10, 0), Vector(1, 0)),
+                "d": Port("d", Point(5, 5), diagonal),
+            },
+        )
+        assert [p.id for p in sym.ports_facing(Vector(1, 0))] == ["r"]
+        assert [p.id for p in sym.ports_facing(Vector(-1.0, 0.0))] == ["l"]
+        assert [p.id for p in sym.ports_facing(diagonal)] == ["d"]
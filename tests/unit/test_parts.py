@@ -1,3 +1,10 @@
+"""
+Unit tests for the model.parts helpers and multi-pole factories.
+
+The assertions here are simple scalar/membership checks, so pytest's
+assertion rewriting is disabled for this module: PYTEST_DONT_REWRITE
+"""
+
 import pytest
 
 from pyschemaelectrical.model.core import Point, Port, Symbol, Vector
@@ -11,6 +18,30 @@ from pyschemaelectrical.model.parts import (
 )
 from pyschemaelectrical.model.primitives import Circle, Line, Polygon
 
+# Shared single-pole mock for the multi-pole factory tests.  Symbols and
+# their parts are immutable, so one set of ports serves every call.
+_MOCK_POLE_PORTS = {
+    "1": Port("1", Point(0, 0), Vector(0, -1)),
+    "2": Port("2", Point(0, 10), Vector(0, 1)),
+}
+_MOCK_POLE_LINE = Line(Point(0, 0), Point(0, 10))
+
+
+def _mock_pole(label="", pins=()):
+    """Single pole: one vertical line with an up port "1" and down port "2"."""
+    return Symbol(elements=[_MOCK_POLE_LINE], ports=_MOCK_POLE_PORTS, label=label)
+
+
+@pytest.fixture(scope="module")
+def three_pole_sym():
+    """Three-pole symbol built once from :func:`_mock_pole` (10mm spacing)."""
+    return three_pole_factory(
+        single_pole_func=_mock_pole,
+        label="-Q1",
+        pins=("1", "2", "3", "4", "5", "6"),
+        pole_spacing=10.0,
+    )
+
 
 class TestPartsUnit:
     def test_standard_text(self):
@@ -51,43 +82,20 @@ class TestPartsUnit:
         assert labels[0].position.x < 0
         assert labels[1].position.x < 0
 
-    def test_three_pole_factory(self):
-        # Mock single pole function
-        def mock_pole(label, pins):
-            # Returns a symbol with 2 ports and a line
-            return Symbol(
-                elements=[Line(Point(0, 0), Point(0, 10))],
-                ports={
-                    "1": Port("1", Point(0, 0), Vector(0, -1)),
-                    "2": Port("2", Point(0, 10), Vector(0, 1)),
-                },
-                label=label,
-            )
-
-        sym = three_pole_factory(
-            single_pole_func=mock_pole,
-            label="-Q1",
-            pins=("1", "2", "3", "4", "5", "6"),
-            pole_spacing=10.0,
-        )
-
-        assert sym.label == "-Q1"
-        assert len(sym.elements) == 3
-
-        assert "1" in sym.ports
-        assert "3" in sym.ports  # Mapped from pole 2 pin 1
-        assert "5" in sym.ports  # Mapped from pole 3 pin 1
+    def test_three_pole_factory(self, three_pole_sym):
+        assert three_pole_sym.label == "-Q1"
+        assert len(three_pole_sym.elements) == 3
 
-        assert sym.ports["1"].position.x == 0
-        assert sym.ports["3"].position.x == 10
-        assert sym.ports["5"].position.x == 20
+    @pytest.mark.parametrize(
+        ("port", "expected_x"),
+        [("1", 0), ("3", 10), ("5", 20)],  # pin 1 of poles 1, 2 and 3
+    )
+    def test_three_pole_factory_port_x(self, three_pole_sym, port, expected_x):
+        assert three_pole_sym.ports[port].position.x == expected_x
 
     def test_three_pole_factory_validation(self):
-        def mock_pole(**kwargs):
-            return Symbol([], {}, "")
-
         with pytest.raises(ValueError):
-            three_pole_factory(mock_pole, pins=("1", "2"))  # Invalid len
+            three_pole_factory(_mock_pole, pins=("1", "2"))  # Invalid len
 
     def test_create_pin_labels_preserves_insertion_order(self):
         """Pin labels should follow port insertion order, not alphabetical order."""
@@ -126,86 +134,36 @@ class TestPartsUnit:
     def test_three_pole_factory_pole_spacing_zero_raises(self):
         """three_pole_factory should raise ValueError when pole_spacing <= 0."""
 
-        def mock_pole(label, pins):
-            return Symbol(
-                elements=[],
-                ports={
-                    "1": Port("1", Point(0, 0), Vector(0, -1)),
-                    "2": Port("2", Point(0, 10), Vector(0, 1)),
-                },
-                label=label,
-            )
-
         with pytest.raises(ValueError, match="pole_spacing must be positive"):
             three_pole_factory(
-                mock_pole, pins=("1", "2", "3", "4", "5", "6"), pole_spacing=0
+                _mock_pole, pins=("1", "2", "3", "4", "5", "6"), pole_spacing=0
             )
 
     def test_three_pole_factory_pole_spacing_negative_raises(self):
         """three_pole_factory should raise ValueError when pole_spacing is negative."""
 
-        def mock_pole(label, pins):
-            return Symbol(
-                elements=[],
-                ports={
-                    "1": Port("1", Point(0, 0), Vector(0, -1)),
-                    "2": Port("2", Point(0, 10), Vector(0, 1)),
-                },
-                label=label,
-            )
-
         with pytest.raises(ValueError, match="pole_spacing must be positive"):
             three_pole_factory(
-                mock_pole, pins=("1", "2", "3", "4", "5", "6"), pole_spacing=-5.0
+                _mock_pole, pins=("1", "2", "3", "4", "5", "6"), pole_spacing=-5.0
             )
 
     def test_two_pole_factory_pole_spacing_zero_raises(self):
         """two_pole_factory should raise ValueError when pole_spacing <= 0."""
 
-        def mock_pole(label, pins):
-            return Symbol(
-                elements=[],
-                ports={
-                    "1": Port("1", Point(0, 0), Vector(0, -1)),
-                    "2": Port("2", Point(0, 10), Vector(0, 1)),
-                },
-                label=label,
-            )
-
         with pytest.raises(ValueError, match="pole_spacing must be positive"):
-            two_pole_factory(mock_pole, pins=("1", "2", "3", "4"), pole_spacing=0)
+            two_pole_factory(_mock_pole, pins=("1", "2", "3", "4"), pole_spacing=0)
 
     def test_two_pole_factory_pole_spacing_negative_raises(self):
         """two_pole_factory should raise ValueError when pole_spacing is negative."""
 
-        def mock_pole(label, pins):
-            return Symbol(
-                elements=[],
-                ports={
-                    "1": Port("1", Point(0, 0), Vector(0, -1)),
-                    "2": Port("2", Point(0, 10), Vector(0, 1)),
-                },
-                label=label,
-            )
-
         with pytest.raises(ValueError, match="pole_spacing must be positive"):
-            two_pole_factory(mock_pole, pins=("1", "2", "3", "4"), pole_spacing=-1.0)
+            two_pole_factory(_mock_pole, pins=("1", "2", "3", "4"), pole_spacing=-1.0)
 
     def test_two_pole_factory_valid_pole_spacing(self):
         """two_pole_factory should succeed with a positive pole_spacing."""
 
-        def mock_pole(label, pins):
-            return Symbol(
-                elements=[Line(Point(0, 0), Point(0, 10))],
-                ports={
-                    "1": Port("1", Point(0, 0), Vector(0, -1)),
-                    "2": Port("2", Point(0, 10), Vector(0, 1)),
-                },
-                label=label,
-            )
-
         sym = two_pole_factory(
-            mock_pole, label="-F1", pins=("1", "2", "3", "4"), pole_spacing=10.0
+            _mock_pole, label="-F1", pins=("1", "2", "3", "4"), pole_spacing=10.0
         )
         assert sym.label == "-F1"
         assert "1" in sym.ports
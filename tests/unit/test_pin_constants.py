@@ -0,0 +1,41 @@
+"""Tests for the flat pin constant tuples in model.constants."""
+
+import pytest
+
+from pyschemaelectrical.model.constants import (
+    CB_2P_PINS,
+    CB_3P_PINS,
+    COIL_PINS,
+    CONTACTOR_3P_PINS,
+    NC_CONTACT_PINS,
+    NO_CONTACT_PINS,
+    THERMAL_OVERLOAD_PINS,
+)
+
+
+class TestStandardPins:
+    """Tests for flat pin constant definitions."""
+
+    @pytest.mark.parametrize(
+        ("pins", "expected"),
+        [
+            (COIL_PINS, ("A1", "A2")),
+            (NO_CONTACT_PINS, ("13", "14")),
+            (NC_CONTACT_PINS, ("11", "12")),
+            (CB_3P_PINS, ("1", "2", "3", "4", "5", "6")),
+            (CB_2P_PINS, ("1", "2", "3", "4")),
+            (CONTACTOR_3P_PINS, ("L1", "T1", "L2", "T2", "L3", "T3")),
+            (THERMAL_OVERLOAD_PINS, ("", "T1", "", "T2", "", "T3")),
+        ],
+        ids=[
+            "coil",
+            "no_contact",
+            "nc_contact",
+            "cb_3p",
+            "cb_2p",
+            "contactor_3p",
+            "thermal_overload",
+        ],
+    )
+    def test_pin_set(self, pins, expected):
+        assert pins == expected
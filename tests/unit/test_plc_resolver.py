@@ -12,14 +12,23 @@ import dataclasses
 
 import pytest
 
+from pyschemaelectrical import create_initial_state
 from pyschemaelectrical.plc_resolver import (
     PlcDesignation,
     PlcModuleType,
     PlcRack,
+    _find_modules_for_type,
+    _index_rack,
     extract_plc_connections_from_registry,
     generate_plc_report_rows,
+    iter_plc_report_rows,
     resolve_plc_references,
 )
+from pyschemaelectrical.system.connection_registry import (
+    Connection,
+    TerminalRegistry,
+    update_registry,
+)
 from pyschemaelectrical.utils.utils import natural_sort_key
 
 # ---------------------------------------------------------------------------
@@ -48,25 +57,18 @@ def make_small_rack() -> PlcRack:
 
 
 class TestNaturalSortKey:
-    def test_orders_numeric_suffixes(self):
-        tags = ["K10", "K2", "K1"]
-        result = sorted(tags, key=natural_sort_key)
-        assert result == ["K1", "K2", "K10"]
-
-    def test_pure_numbers(self):
-        tags = ["10", "2", "1"]
-        result = sorted(tags, key=natural_sort_key)
-        assert result == ["1", "2", "10"]
-
-    def test_mixed_prefix(self):
-        tags = ["DI10", "DI2", "RTD1"]
-        result = sorted(tags, key=natural_sort_key)
-        assert result == ["DI2", "DI10", "RTD1"]
-
-    def test_no_numbers(self):
-        tags = ["beta", "alpha", "gamma"]
-        result = sorted(tags, key=natural_sort_key)
-        assert result == ["alpha", "beta", "gamma"]
+    @pytest.mark.parametrize(
+        ("tags", "expected"),
+        [
+            (["K10", "K2", "K1"], ["K1", "K2", "K10"]),
+            (["10", "2", "1"], ["1", "2", "10"]),
+            (["DI10", "DI2", "RTD1"], ["DI2", "DI10", "RTD1"]),
+            (["beta", "alpha", "gamma"], ["alpha", "beta", "gamma"]),
+        ],
+        ids=["numeric_suffixes", "pure_numbers", "mixed_prefix", "no_numbers"],
+    )
+    def test_sorted_order(self, tags, expected):
+        assert sorted(tags, key=natural_sort_key) == expected
 
     def test_single_item(self):
         assert natural_sort_key("K1") == ["K", 1, ""]
@@ -105,6 +107,9 @@ class TestPlcModuleType:
         with pytest.raises(dataclasses.FrozenInstanceError):
             mod.channels = 4  # type: ignore[misc]
 
+    def test_slotted(self):
+        assert not hasattr(PlcModuleType("", "DI", 8, ("",)), "__dict__")
+
     def test_equality(self):
         a = PlcModuleType("mpn", "DI", 8, ("",))
         b = PlcModuleType("mpn", "DI", 8, ("",))
@@ -117,40 +122,30 @@ class TestPlcModuleType:
 
 
 class TestPlcDesignationParse:
-    def test_generic_single_pin(self):
-        d = PlcDesignation.parse("PLC:DO")
-        assert d is not None
-        assert d.type == "DO"
-        assert d.instance is None
-        assert d.signal is None
-
-    def test_generic_with_signal(self):
-        d = PlcDesignation.parse("PLC:RTD:+R")
-        assert d is not None
-        assert d.type == "RTD"
-        assert d.instance is None
-        assert d.signal == "+R"
-
-    def test_specific_instance(self):
-        d = PlcDesignation.parse("PLC:DO1")
-        assert d is not None
-        assert d.type == "DO"
-        assert d.instance == 1
-        assert d.signal is None
-
-    def test_specific_instance_two_digits(self):
-        d = PlcDesignation.parse("PLC:DI12")
-        assert d is not None
-        assert d.type == "DI"
-        assert d.instance == 12
-        assert d.signal is None
-
-    def test_ai_with_signal(self):
-        d = PlcDesignation.parse("PLC:AI:Sig")
-        assert d is not None
-        assert d.type == "AI"
-        assert d.instance is None
-        assert d.signal == "Sig"
+    @pytest.mark.parametrize(
+        ("tag", "plc_type", "instance", "signal"),
+        [
+            ("PLC:DO", "DO", None, None),
+            ("PLC:RTD:+R", "RTD", None, "+R"),
+            ("PLC:DO1", "DO", 1, None),
+            ("PLC:DI12", "DI", 12, None),
+            ("PLC:AI:Sig", "AI", None, "Sig"),
+            # A type that does not split into letters+digits is kept as-is
+            ("PLC:4-20mA:Sig", "4-20mA", None, "Sig"),
+        ],
+        ids=[
+            "generic_single_pin",
+            "generic_with_signal",
+            "specific_instance",
+            "specific_instance_two_digits",
+            "ai_with_signal",
+            "unsplittable_type",
+        ],
+    )
+    def test_parse(self, tag, plc_type, instance, signal):
+        assert PlcDesignation.parse(tag) == PlcDesignation(
+            type=plc_type, instance=instance, signal=signal
+        )
 
     def test_non_plc_tag_returns_none(self):
         assert PlcDesignation.parse("X100") is None
@@ -164,12 +159,27 @@ class TestPlcDesignationParse:
         assert d is not None
         assert d.type == "AI"
 
+    def test_repeat_parse_shares_instance(self):
+        """Designations are frozen, so repeated parses return one object."""
+        assert PlcDesignation.parse("PLC:RTD:+R") is PlcDesignation.parse("PLC:RTD:+R")
+
+    def test_subclass_parse_returns_subclass(self):
+        class Sub(PlcDesignation):
+            pass
+
+        d = Sub.parse("PLC:DO1")
+        assert type(d) is Sub
+        assert type(PlcDesignation.parse("PLC:DO1")) is PlcDesignation
+
     def test_frozen(self):
         d = PlcDesignation.parse("PLC:DO")
         assert d is not None
         with pytest.raises(dataclasses.FrozenInstanceError):
             d.type = "DI"  # type: ignore[misc]
 
+    def test_slotted(self):
+        assert not hasattr(PlcDesignation.parse("PLC:DO"), "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # PlcDesignation.__str__()
@@ -209,6 +219,41 @@ class TestPlcDesignationStr:
         assert str(d) == "PLC:DO0"
 
 
+# ---------------------------------------------------------------------------
+# _find_modules_for_type()
+# ---------------------------------------------------------------------------
+
+
+class TestFindModulesForType:
+    def test_prefix_match_keeps_rack_order(self):
+        rack = [("DI2", DI_MODULE), ("DO1", DO_MODULE), ("DI1", DI_MODULE)]
+        assert _find_modules_for_type("DI", rack) == [
+            ("DI2", DI_MODULE),
+            ("DI1", DI_MODULE),
+        ]
+
+    def test_falls_back_to_signal_type(self):
+        rack = make_small_rack()
+        assert _find_modules_for_type("4-20mA", rack) == [("AI1", MA_MODULE)]
+
+    def test_unknown_type_returns_empty(self):
+        assert _find_modules_for_type("XX", make_small_rack()) == []
+
+    def test_precomputed_index_matches(self):
+        rack = make_small_rack()
+        index = _index_rack(rack)
+        for plc_type in ("RTD", "AI", "4-20mA", "DI", "XX"):
+            assert _find_modules_for_type(
+                plc_type, rack, index
+            ) == _find_modules_for_type(plc_type, rack)
+
+    def test_result_does_not_alias_index(self):
+        rack = make_small_rack()
+        index = _index_rack(rack)
+        _find_modules_for_type("DI", rack, index).clear()
+        assert _find_modules_for_type("DI", rack, index) == [("DI1", DI_MODULE)]
+
+
 # ---------------------------------------------------------------------------
 # resolve_plc_references()  — single-pin references (DI, DO)
 # ---------------------------------------------------------------------------
@@ -221,10 +266,8 @@ class TestResolvePlcReferencesSinglePin:
             ("SW-01", "Signal", "X100", "1", "PLC:DI", ""),
         ]
         result = resolve_plc_references(connections, rack)
-        assert len(result) == 1
-        row = result[0]
-        assert row[4] == "PLC:DI1"
-        assert row[5] == "1"  # channel 1, no suffix
+        # channel 1, no suffix
+        assert result == [("SW-01", "Signal", "X100", "1", "PLC:DI1", "1")]
 
     def test_resolves_multiple_di_references_in_order(self):
         """Three DI connections across two modules, ordered by terminal pin."""
@@ -236,10 +279,11 @@ class TestResolvePlcReferencesSinglePin:
         ]
         result = resolve_plc_references(connections, rack)
         # Should be sorted by terminal pin: 1, 2, 3 → DI1.1, DI1.2, DI1.3
-        plc_pins = [r[5] for r in result]
-        assert plc_pins == ["1", "2", "3"]
-        plc_modules = [r[4] for r in result]
-        assert all(m == "PLC:DI1" for m in plc_modules)
+        assert result == [
+            ("SW-01", "Signal", "X100", "1", "PLC:DI1", "1"),
+            ("SW-02", "Signal", "X100", "2", "PLC:DI1", "2"),
+            ("SW-03", "Signal", "X100", "3", "PLC:DI1", "3"),
+        ]
 
     def test_non_plc_connections_pass_through(self):
         rack = make_small_rack()
@@ -290,11 +334,12 @@ class TestResolvePlcReferencesMultiPin:
             ("TT-01", "R-", "X200", "3", "PLC:RTD:-R", ""),
         ]
         result = resolve_plc_references(connections, rack)
-        assert len(result) == 3
         # All pins for TT-01 should land on channel 1 of RTD1
-        for row in result:
-            assert row[4] == "PLC:RTD1"
-            assert row[5].endswith("1")  # "+R1", "RL1", "-R1"
+        assert result == [
+            ("TT-01", "R+", "X200", "1", "PLC:RTD1", "+R1"),
+            ("TT-01", "RL", "X200", "2", "PLC:RTD1", "RL1"),
+            ("TT-01", "R-", "X200", "3", "PLC:RTD1", "-R1"),
+        ]
 
     def test_resolves_4_20ma_two_devices(self):
         rack: PlcRack = [("AI1", MA_MODULE)]
@@ -305,12 +350,13 @@ class TestResolvePlcReferencesMultiPin:
             ("PT-02", "GND", "X200", "4", "PLC:AI:GND", ""),
         ]
         result = resolve_plc_references(connections, rack)
-        assert len(result) == 4
-        pt01_rows = [r for r in result if r[0] == "PT-01"]
-        pt02_rows = [r for r in result if r[0] == "PT-02"]
         # PT-01 → channel 1, PT-02 → channel 2
-        assert all(r[5].endswith("1") for r in pt01_rows)
-        assert all(r[5].endswith("2") for r in pt02_rows)
+        assert result == [
+            ("PT-01", "Sig+", "X200", "1", "PLC:AI1", "Sig1"),
+            ("PT-01", "GND", "X200", "2", "PLC:AI1", "GND1"),
+            ("PT-02", "Sig+", "X200", "3", "PLC:AI1", "Sig2"),
+            ("PT-02", "GND", "X200", "4", "PLC:AI1", "GND2"),
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -347,17 +393,11 @@ class TestResolvePlcReferences:
 # ---------------------------------------------------------------------------
 
 
-class TestExtractPlcConnectionsFromRegistry:
-    def _make_state_with_connections(self, connections):
-        """Build a GenerationState whose registry contains the given connections."""
-        from pyschemaelectrical import create_initial_state
-        from pyschemaelectrical.system.connection_registry import (
-            Connection,
-            TerminalRegistry,
-            update_registry,
-        )
+@pytest.fixture(scope="module")
+def state_factory():
+    """Return a builder for a GenerationState whose registry holds *connections*."""
 
-        state = create_initial_state()
+    def _make(connections):
         reg = TerminalRegistry(
             tuple(
                 Connection(
@@ -370,11 +410,15 @@ class TestExtractPlcConnectionsFromRegistry:
                 for c in connections
             )
         )
-        return update_registry(state, reg)
+        return update_registry(create_initial_state(), reg)
+
+    return _make
 
-    def test_extracts_di_from_registry(self):
+
+class TestExtractPlcConnectionsFromRegistry:
+    def test_extracts_di_from_registry(self, state_factory):
         rack: PlcRack = [("DI1", DI_MODULE)]
-        state = self._make_state_with_connections(
+        state = state_factory(
             [
                 {
                     "terminal_tag": "PLC:DI",
@@ -388,13 +432,13 @@ class TestExtractPlcConnectionsFromRegistry:
         assert len(result) == 1
         assert result[0][4] == "PLC:DI1"
 
-    def test_skips_used_channels(self):
+    def test_skips_used_channels(self, state_factory):
         rack: PlcRack = [("DI1", DI_MODULE)]
         # Channel 1 already occupied by existing connections
         existing: list = [
             ("SW-EXT", "Signal", "X100", "1", "PLC:DI1", "1"),
         ]
-        state = self._make_state_with_connections(
+        state = state_factory(
             [
                 {
                     "terminal_tag": "PLC:DI",
@@ -411,9 +455,9 @@ class TestExtractPlcConnectionsFromRegistry:
         # Should be assigned to channel 2 (channel 1 is used)
         assert result[0][5] == "2"
 
-    def test_extracts_multi_pin_from_registry(self):
+    def test_extracts_multi_pin_from_registry(self, state_factory):
         rack: PlcRack = [("RTD1", RTD_MODULE)]
-        state = self._make_state_with_connections(
+        state = state_factory(
             [
                 {
                     "terminal_tag": "PLC:RTD:+R",
@@ -440,15 +484,15 @@ class TestExtractPlcConnectionsFromRegistry:
         for row in result:
             assert row[4] == "PLC:RTD1"
 
-    def test_empty_registry_returns_empty(self):
+    def test_empty_registry_returns_empty(self, state_factory):
         rack = make_small_rack()
-        state = self._make_state_with_connections([])
+        state = state_factory([])
         result = extract_plc_connections_from_registry(state, rack)
         assert result == []
 
-    def test_non_plc_registry_connections_ignored(self):
+    def test_non_plc_registry_connections_ignored(self, state_factory):
         rack: PlcRack = [("DI1", DI_MODULE)]
-        state = self._make_state_with_connections(
+        state = state_factory(
             [
                 {
                     "terminal_tag": "X100",
@@ -551,6 +595,22 @@ class TestGeneratePlcReportRows:
 
         assert callable(fn)
 
+    def test_iter_matches_list(self):
+        """iter_plc_report_rows streams the same rows, lazily."""
+        rack = make_small_rack()
+        connections = [
+            ("SW-01", "Signal", "X100", "1", "PLC:DI1", "1"),
+            ("TT-01", "R+", "X200", "1", "PLC:RTD1", "+R1"),
+        ]
+        rows = iter_plc_report_rows(connections, rack)
+        assert not isinstance(rows, list)
+        assert list(rows) == generate_plc_report_rows(connections, rack)
+
+    def test_iter_public_api_import(self):
+        from pyschemaelectrical import iter_plc_report_rows as fn
+
+        assert fn is iter_plc_report_rows
+
 
 # ---------------------------------------------------------------------------
 # Public API imports
@@ -11,6 +11,13 @@ class TestPrimitivesUnit:
         assert line.end == p2
         assert isinstance(line.style, Style)
 
+    def test_default_style_is_shared(self):
+        line = Line(Point(0, 0), Point(1, 1))
+        circle = Circle(Point(0, 0), 1)
+        text = Text("T", Point(0, 0))
+        assert line.style is circle.style is text.style
+        assert line.style == Style()
+
     def test_circle(self):
         center = Point(5, 5)
         circle = Circle(center=center, radius=3.0)
@@ -1,6 +1,7 @@
 from pyschemaelectrical.model.core import Point, Style, Symbol
 from pyschemaelectrical.model.primitives import Circle, Group, Line, Path, Polygon, Text
 from pyschemaelectrical.utils.renderer import (
+    _style_to_str,
     calculate_bounds,
     render_to_svg,
     save_svg,
@@ -37,6 +38,11 @@ class TestRendererUnit:
         assert sym_g.get("class") == "symbol"
         assert sym_g.find("line") is not None
 
+    def test_default_style_string_matches_equal_style(self):
+        default = Line(Point(0, 0), Point(1, 1)).style
+        assert _style_to_str(default) == _style_to_str(Style())
+        assert _style_to_str(default) == "stroke:black;stroke-width:1.0;fill:none"
+
     def test_style_application(self):
         style = Style(stroke="red", stroke_width=2)
         line = Line(Point(0, 0), Point(10, 10), style=style)
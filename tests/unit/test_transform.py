@@ -1,6 +1,7 @@
 import math
 import warnings
 
+from pyschemaelectrical.model.constants import TEXT_OFFSET_X
 from pyschemaelectrical.model.core import Point, Port, Style, Symbol, Vector
 from pyschemaelectrical.model.primitives import Circle, Group, Line, Path, Polygon, Text
 from pyschemaelectrical.utils.transform import (
@@ -10,6 +11,7 @@ from pyschemaelectrical.utils.transform import (
     rotate_point,
     rotate_vector,
     translate,
+    translate_points,
 )
 
 
@@ -147,6 +149,12 @@ class TestTransformUnit:
         assert poly2.points[1] == Point(6, 5)
         assert poly2.points[2] == Point(5.5, 6)
 
+    def test_translate_points(self):
+        pts = [Point(0, 0), Point(1, -2)]
+        assert translate_points(pts, 5, 5) == [Point(5, 5), Point(6, 3)]
+        assert translate_points(iter(pts), 0, 0) == pts
+        assert translate_points([], 1, 1) == []
+
     def test_translate_path(self):
         p = Path(d="M 0 0 L 10 10")
         p2 = translate(p, 5, 5)
@@ -667,8 +675,6 @@ class TestTransformUnit:
     def test_rotate_symbol_label_text_forced_position(self):
         """When a Symbol's label matches a Text element's content,
         the text is forced to a fixed position during rotation."""
-        from pyschemaelectrical.model.constants import TEXT_OFFSET_X
-
         label_text = Text(content="K1", position=Point(5, 0), anchor="start")
         line = Line(Point(0, 0), Point(0, 10))
         sym = Symbol(elements=[label_text, line], ports={}, label="K1")
@@ -685,52 +685,44 @@ class TestGetTemplatePath:
 
 
 class TestMarkdownToTypst:
-    def test_happy_path(self):
+    def test_happy_path(self, tmp_path):
         """markdown_to_typst should convert a real markdown file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = os.path.join(tmpdir, "test.md")
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write("# Heading\n\nParagraph text\n")
+        md_path = tmp_path / "test.md"
+        md_path.write_text("# Heading\n\nParagraph text\n", encoding="utf-8")
 
-            result = markdown_to_typst(md_path)
-            assert "= Heading" in result
-            assert "Paragraph text" in result
-            assert "#pagebreak()" in result
+        result = markdown_to_typst(str(md_path))
+        assert "= Heading" in result
+        assert "Paragraph text" in result
+        assert "#pagebreak()" in result
 
     def test_file_not_found_returns_empty(self):
         """markdown_to_typst should return empty string for missing file."""
         result = markdown_to_typst("/nonexistent/path.md")
         assert result == ""
 
-    def test_with_notice(self):
+    def test_with_notice(self, tmp_path):
         """markdown_to_typst should include notice block when provided."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = os.path.join(tmpdir, "test.md")
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write("# Title\n")
+        md_path = tmp_path / "test.md"
+        md_path.write_text("# Title\n", encoding="utf-8")
 
-            result = markdown_to_typst(md_path, notice="Notice text here")
-            assert "Notice text here" in result
+        result = markdown_to_typst(str(md_path), notice="Notice text here")
+        assert "Notice text here" in result
 
-    def test_without_notice(self):
+    def test_without_notice(self, tmp_path):
         """markdown_to_typst without notice should not contain notice block."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = os.path.join(tmpdir, "test.md")
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write("# Title\n")
+        md_path = tmp_path / "test.md"
+        md_path.write_text("# Title\n", encoding="utf-8")
 
-            result = markdown_to_typst(md_path, notice=None)
-            assert "#place(" not in result
+        result = markdown_to_typst(str(md_path), notice=None)
+        assert "#place(" not in result
 
-    def test_custom_width(self):
+    def test_custom_width(self, tmp_path):
         """markdown_to_typst should use the provided width."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = os.path.join(tmpdir, "test.md")
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write("# Title\n")
+        md_path = tmp_path / "test.md"
+        md_path.write_text("# Title\n", encoding="utf-8")
 
-            result = markdown_to_typst(md_path, width="80%")
-            assert "80%" in result
+        result = markdown_to_typst(str(md_path), width="80%")
+        assert "80%" in result
 
 
 class TestConvertLines: